@@ -0,0 +1,84 @@
+"""Compare `AlertEngine` with a naive scan over every alert.
+
+usage: poetry run python benchmarks/alerts_bench.py [--alerts 100000] [--symbols 2000] [--ticks 20000]
+"""
+import argparse
+import random
+import time
+
+from juga.alerts import Alert, AlertEngine
+
+
+def make_alerts(n_alerts: int, n_symbols: int, rng: random.Random) -> list[Alert]:
+    alerts = []
+    for i in range(n_alerts):
+        symbol = f"{rng.randrange(n_symbols):06d}"
+        if rng.random() < 0.8:
+            alert = Alert(str(i), symbol, "price", rng.uniform(90, 110), rng.choice(["up", "down", "both"]), once=False)
+        else:
+            alert = Alert(str(i), symbol, "move", rng.uniform(1, 10), once=False)
+        alerts.append(alert)
+    return alerts
+
+
+def make_ticks(n_ticks: int, n_symbols: int, rng: random.Random) -> list[tuple[str, float, float]]:
+    prices = {f"{i:06d}": 100.0 for i in range(n_symbols)}
+    ticks = []
+    for _ in range(n_ticks):
+        symbol = f"{rng.randrange(n_symbols):06d}"
+        prices[symbol] *= 1 + rng.gauss(0, 0.005)
+        ticks.append((symbol, prices[symbol], (prices[symbol] - 100.0)))
+    return ticks
+
+
+def naive(alerts: list[Alert], ticks: list[tuple[str, float, float]]) -> int:
+    last: dict[str, tuple[float, float]] = {}
+    fired = 0
+    for symbol, price, ratio in ticks:
+        if symbol in last:
+            prev_price, prev_ratio = last[symbol]
+            for alert in alerts:
+                if alert.symbol != symbol:
+                    continue
+                if alert.kind == "move":
+                    fired += prev_ratio < alert.value <= ratio or ratio <= -alert.value < prev_ratio
+                else:
+                    up = prev_price < alert.value <= price and alert.direction != "down"
+                    down = price <= alert.value < prev_price and alert.direction != "up"
+                    fired += up or down
+        last[symbol] = (price, ratio)
+    return fired
+
+
+def main(n_alerts: int, n_symbols: int, n_ticks: int):
+    rng = random.Random(0)
+    alerts = make_alerts(n_alerts, n_symbols, rng)
+    ticks = make_ticks(n_ticks, n_symbols, rng)
+
+    started = time.perf_counter()
+    engine = AlertEngine(tuple(alerts))
+    build = time.perf_counter() - started
+
+    started = time.perf_counter()
+    fired = sum(len(engine.update(symbol, price, ratio)) for symbol, price, ratio in ticks)
+    indexed = time.perf_counter() - started
+
+    # the naive scan is slow, so only time a slice of the ticks
+    naive_ticks = ticks[: max(1, n_ticks // 100)]
+    started = time.perf_counter()
+    naive(alerts, naive_ticks)
+    naive_per_tick = (time.perf_counter() - started) / len(naive_ticks)
+
+    print(f"{n_alerts} alerts on {n_symbols} symbols, {n_ticks} ticks, {fired} events")
+    print(f"  index build : {build * 1000:.1f}ms")
+    print(f"  AlertEngine : {indexed / n_ticks * 1e6:.2f}us/tick")
+    print(f"  naive scan  : {naive_per_tick * 1e6:.2f}us/tick")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--alerts", type=int, default=100_000)
+    parser.add_argument("--symbols", type=int, default=2000)
+    parser.add_argument("--ticks", type=int, default=20_000)
+    args = parser.parse_args()
+    main(args.alerts, args.symbols, args.ticks)
@@ -0,0 +1,71 @@
+"""Measure `Screener` over a synthetic universe of snapshots.
+
+usage: poetry run python benchmarks/screener_bench.py [--symbols 5000]
+"""
+import argparse
+import json
+import random
+import time
+from pathlib import Path
+
+from juga.naver_stock_models import NaverStockChartURLs
+from juga.screener import Screener
+from juga.stock_scraper_base import NaverStockData
+
+TESTDATA = Path(__file__).resolve().parent.parent / "tests"
+BASIC = json.loads((TESTDATA / "230826_m_api_basic_naver_result.json").read_text())
+QUERY = "PER < 10 and 배당수익률 > 3% order by compare_ratio desc"
+
+
+def make_snapshots(n_symbols: int):
+    rng = random.Random(0)
+    chart_urls = NaverStockChartURLs(**BASIC["imageCharts"])
+    return [
+        NaverStockData(
+            name=f"STOCK{i}",
+            name_eng=f"STOCK{i}",
+            symbol_code=f"{i:06d}",
+            close_price=f"{rng.randint(1000, 500000):,}",
+            market_value=f"{rng.randint(1, 400):,}조 {rng.randint(0, 9999):,}억",
+            stock_exchange_name="KOSPI",
+            compare_price=f"{rng.randint(-5000, 5000):,}",
+            compare_ratio=f"{rng.uniform(-10, 10):.2f}",
+            total_infos={
+                "PER": f"{rng.uniform(1, 60):.2f}배" if rng.random() > 0.1 else "N/A",
+                "PBR": f"{rng.uniform(0.2, 10):.2f}배",
+                "EPS": f"{rng.randint(-5000, 50000):,}",
+                "배당수익률": f"{rng.uniform(0, 8):.2f}%",
+                "외인소진율": f"{rng.uniform(0, 60):.2f}%",
+                "52주 최고": f"{rng.randint(1000, 600000):,}",
+                "52주 최저": f"{rng.randint(500, 300000):,}",
+            },
+            chart_urls=chart_urls,
+            url=f"https://m.stock.naver.com/domestic/stock/{i:06d}/total",
+        )
+        for i in range(n_symbols)
+    ]
+
+
+def main(n_symbols: int):
+    snapshots = make_snapshots(n_symbols)
+
+    started = time.perf_counter()
+    screener = Screener(snapshots)
+    results = screener.screen(QUERY)
+    first = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(100):
+        screener.screen(QUERY)
+    repeated = (time.perf_counter() - started) / 100
+
+    print(f"{n_symbols} symbols, {len(results)} matches for {QUERY!r}")
+    print(f"  first query (parses columns): {first * 1000:.2f}ms")
+    print(f"  repeated query              : {repeated * 1000:.3f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--symbols", type=int, default=5000)
+    args = parser.parse_args()
+    main(args.symbols)
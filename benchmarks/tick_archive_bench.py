@@ -0,0 +1,60 @@
+"""Write a year of 10s polled ticks for one symbol into a `TickArchive` and
+time range reads.
+
+usage: poetry run python benchmarks/tick_archive_bench.py [--days 250]
+"""
+import argparse
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from juga.tick_archive import TICK_DTYPE, TickArchive
+
+KST = timezone(timedelta(hours=9))
+TICKS_PER_DAY = 6 * 360 + 180  # 09:00 - 15:30 every 10 seconds
+
+
+def main(n_days: int):
+    rng = random.Random(0)
+    first_day = datetime(2023, 1, 2, 9, 0, tzinfo=KST)
+
+    with tempfile.TemporaryDirectory() as root:
+        archive = TickArchive(root)
+        price, volume = 211_000, 0
+        started = time.perf_counter()
+        for day in range(n_days):
+            day_open = first_day + timedelta(days=day)
+            volume = 0
+            for i in range(TICKS_PER_DAY):
+                price = max(100, price + rng.choice((-500, 0, 0, 500)))
+                volume += rng.randrange(0, 5000)
+                archive.append_tick("035420", day_open + timedelta(seconds=10 * i), price, price - 211_000, volume)
+        archive.flush()
+        write = time.perf_counter() - started
+
+        n_ticks = n_days * TICKS_PER_DAY
+        size = sum(path.stat().st_size for path in Path(root).rglob("*") if path.is_file())
+
+        started = time.perf_counter()
+        year = archive.read("035420", first_day, first_day + timedelta(days=n_days))
+        read_all = time.perf_counter() - started
+
+        hour_start = first_day + timedelta(days=n_days // 2, hours=2)
+        started = time.perf_counter()
+        hour = archive.read("035420", hour_start, hour_start + timedelta(hours=1))
+        read_hour = time.perf_counter() - started
+
+    print(f"{n_ticks} ticks over {n_days} days")
+    print(f"  write      : {write:.2f}s")
+    print(f"  on disk    : {size / 1024:.0f}KiB ({size / (n_ticks * TICK_DTYPE.itemsize):.1%} of raw arrays)")
+    print(f"  read all   : {read_all * 1000:.1f}ms ({len(year)} ticks)")
+    print(f"  read 1 hour: {read_hour * 1000:.2f}ms ({len(hour)} ticks)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=int, default=250)
+    args = parser.parse_args()
+    main(args.days)
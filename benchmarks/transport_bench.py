@@ -0,0 +1,137 @@
+"""Compare `AiohttpTransport` (HTTP/1.1) with `HTTPXTransport` (HTTP/2).
+
+Both transports fetch the same JSON payload from local stand-in servers that
+add a fixed latency per response, similar to a remote naver endpoint:
+
+- HTTP/1.1: an `aiohttp.web` application
+- HTTP/2: a minimal cleartext (prior knowledge) server built on `h2`
+
+usage: poetry run python benchmarks/transport_bench.py [--requests 500] [--latency 0.02]
+"""
+import argparse
+import asyncio
+import json
+import time
+from pathlib import Path
+
+import h2.config
+import h2.connection
+import h2.events
+import httpx
+from aiohttp import web
+
+from juga.transport import AiohttpTransport, HTTPTransport, HTTPXTransport
+
+PAYLOAD = (Path(__file__).resolve().parent.parent / "tests" / "230826_api_basic_msft_result.json").read_bytes()
+
+
+class H2StandInProtocol(asyncio.Protocol):
+    connections = 0
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.conn = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=False))
+        self.transport = None
+        self.flow_waiters: dict[int, asyncio.Future] = {}
+
+    def connection_made(self, transport):
+        H2StandInProtocol.connections += 1
+        self.transport = transport
+        self.conn.initiate_connection()
+        self.transport.write(self.conn.data_to_send())
+
+    def data_received(self, data: bytes):
+        for event in self.conn.receive_data(data):
+            if isinstance(event, h2.events.RequestReceived):
+                asyncio.ensure_future(self.respond(event.stream_id))
+            elif isinstance(event, h2.events.WindowUpdated):
+                for waiter in self.flow_waiters.values():
+                    if not waiter.done():
+                        waiter.set_result(None)
+        self.transport.write(self.conn.data_to_send())
+
+    async def respond(self, stream_id: int):
+        await asyncio.sleep(self.latency)
+        self.conn.send_headers(
+            stream_id,
+            [(":status", "200"), ("content-type", "application/json"), ("content-length", str(len(PAYLOAD)))],
+        )
+        data = PAYLOAD
+        while data:
+            window = min(self.conn.local_flow_control_window(stream_id), self.conn.max_outbound_frame_size)
+            if window <= 0:
+                self.flow_waiters[stream_id] = asyncio.get_running_loop().create_future()
+                await self.flow_waiters[stream_id]
+                del self.flow_waiters[stream_id]
+                continue
+            chunk, data = data[:window], data[window:]
+            self.conn.send_data(stream_id, chunk, end_stream=not data)
+            self.transport.write(self.conn.data_to_send())
+        self.transport.write(self.conn.data_to_send())
+
+
+async def start_h1_server(latency: float) -> tuple[web.AppRunner, str, set]:
+    peers: set = set()
+
+    async def handler(request: web.Request) -> web.Response:
+        peers.add(request.transport.get_extra_info("peername"))
+        await asyncio.sleep(latency)
+        return web.Response(body=PAYLOAD, content_type="application/json")
+
+    app = web.Application()
+    app.router.add_get("/stock/{code}/basic", handler)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    return runner, f"http://127.0.0.1:{port}", peers
+
+
+async def start_h2_server(latency: float) -> tuple[asyncio.AbstractServer, str]:
+    loop = asyncio.get_running_loop()
+    server = await loop.create_server(lambda: H2StandInProtocol(latency), "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    return server, f"http://127.0.0.1:{port}"
+
+
+async def run(transport: HTTPTransport, base_url: str, n_requests: int) -> float:
+    urls = [f"{base_url}/stock/T{i}.O/basic" for i in range(n_requests)]
+    async with transport:
+        # warm up the connection(s)
+        await transport.get_json(urls[0])
+        started = time.perf_counter()
+        results = await asyncio.gather(*(transport.get_json(url) for url in urls))
+        elapsed = time.perf_counter() - started
+    assert all(result["symbolCode"] == json.loads(PAYLOAD)["symbolCode"] for result in results)
+    return elapsed
+
+
+async def main(n_requests: int, latency: float):
+    h1_runner, h1_url, h1_peers = await start_h1_server(latency)
+    h2_server, h2_url = await start_h2_server(latency)
+    try:
+        h1_elapsed = await run(AiohttpTransport(), h1_url, n_requests)
+        # http1=False makes httpx speak HTTP/2 over cleartext without an upgrade
+        h2_client = httpx.AsyncClient(http1=False, http2=True, limits=httpx.Limits(max_connections=10))
+        h2_elapsed = await run(HTTPXTransport(client=h2_client), h2_url, n_requests)
+        await h2_client.aclose()
+    finally:
+        await h1_runner.cleanup()
+        h2_server.close()
+        await h2_server.wait_closed()
+
+    print(f"{n_requests} concurrent requests, {latency * 1000:.0f}ms server latency")
+    print(f"  aiohttp (HTTP/1.1): {h1_elapsed:.3f}s, {n_requests / h1_elapsed:8.1f} req/s, {len(h1_peers)} connections")
+    print(
+        f"  httpx   (HTTP/2)  : {h2_elapsed:.3f}s, {n_requests / h2_elapsed:8.1f} req/s, "
+        f"{H2StandInProtocol.connections} connections"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.latency))
@@ -1,4 +1,32 @@
-from .naver_stock_api import NaverStockAPI
+from .alerts import Alert, AlertEngine, AlertEvent
+from .naver_stock_api import NaverStockAPI, stream_stock_data
+from .portfolio import FXRateCache, Holding, Portfolio, PortfolioValuation, PositionValuation
+from .screener import InvalidScreenerQuery, Screener, ScreenerQuery
+from .shared_cache import RedisCacheBackend, SharedCache, SharedCacheBackend, SQLiteCacheBackend
+from .tick_archive import TickArchive
+from .transport import AiohttpTransport, HTTPTransport, HTTPXTransport
 
 
-__all__ = ["NaverStockAPI"]
+__all__ = [
+    "NaverStockAPI",
+    "stream_stock_data",
+    "HTTPTransport",
+    "AiohttpTransport",
+    "HTTPXTransport",
+    "SharedCache",
+    "SharedCacheBackend",
+    "SQLiteCacheBackend",
+    "RedisCacheBackend",
+    "Screener",
+    "ScreenerQuery",
+    "InvalidScreenerQuery",
+    "Alert",
+    "AlertEngine",
+    "AlertEvent",
+    "TickArchive",
+    "Portfolio",
+    "Holding",
+    "PortfolioValuation",
+    "PositionValuation",
+    "FXRateCache",
+]
@@ -4,6 +4,8 @@ from functools import wraps
 import typer
 
 from juga.naver_stock_api import NaverStockAPI, InvalidStockQuery
+from juga.screener import field_value, InvalidScreenerQuery, Screener, ScreenerQuery
+from juga.transport import AiohttpTransport
 
 
 app = typer.Typer()
@@ -36,5 +38,41 @@ async def search(query: str):
     typer.echo(await NaverStockAPI.fetch_metadata(query))
 
 
+@app.command()
+@coro
+async def screen(
+    query: str = typer.Argument(..., help='e.g. "PER < 10 and 배당수익률 > 3% order by compare_ratio desc"'),
+    tickers: list[str] = typer.Argument(..., help="tickers to screen"),
+):
+    try:
+        parsed = ScreenerQuery.parse(query)
+    except InvalidScreenerQuery as e:
+        typer.echo(f"invalid query: {e}")
+        raise typer.Exit(code=1)
+
+    async def fetch(ticker: str):
+        try:
+            api = await NaverStockAPI.from_query(ticker, transport=transport)
+        except InvalidStockQuery:
+            typer.echo(f"failed to find stock. query: {ticker}", err=True)
+            return None
+        return await api.fetch_stock_data()
+
+    async with AiohttpTransport() as transport:
+        snapshots = await asyncio.gather(*(fetch(ticker) for ticker in tickers))
+
+    screener = Screener([snapshot for snapshot in snapshots if snapshot is not None])
+    try:
+        results = screener.screen(parsed)
+    except InvalidScreenerQuery as e:
+        typer.echo(f"invalid query: {e}")
+        raise typer.Exit(code=1)
+
+    fields = sorted(parsed.fields)
+    for stock_data in results:
+        values = " ".join(f"{field}={field_value(stock_data, field)}" for field in fields)
+        typer.echo(f"{stock_data.symbol_code} {stock_data.name} {stock_data.close_price} {values}")
+
+
 def run_cli():
     app()
@@ -0,0 +1,227 @@
+import bisect
+import json
+import math
+import os
+import re
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import AsyncIterable, AsyncIterator, Literal, Optional, Union
+
+from juga.numeric import parse_number
+from juga.stock_scraper_base import NaverStockData
+
+AlertKind = Literal["price", "move"]
+CrossDirection = Literal["up", "down", "both"]
+
+
+@dataclass(frozen=True)
+class Alert:
+    """A user alert on one symbol.
+
+    `symbol` is the reuters code (`NaverStockMetadata.reuters_code`), e.g.
+    "035420" or "MSFT.O".
+
+    - kind="price": fires when the price crosses `value` in `direction`.
+    - kind="move": fires when the change from the previous close
+      (`compare_ratio`, in %) goes above +`value` ("up"), below -`value`
+      ("down"), or either ("both").
+
+    Reaching a threshold counts as crossing it. With `once` the alert is
+    removed after it fires.
+    """
+
+    alert_id: str
+    symbol: str
+    kind: AlertKind
+    value: float
+    direction: CrossDirection = "both"
+    once: bool = True
+
+
+@dataclass(frozen=True)
+class AlertEvent:
+    alert: Alert
+    previous: float
+    current: float
+    stock_data: Optional[NaverStockData] = None
+
+
+class _BoundaryIndex:
+    """Thresholds of one (symbol, field, direction), sorted for range queries."""
+
+    def __init__(self):
+        self.thresholds: list[float] = []
+        self.alert_ids: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self.thresholds)
+
+    def add(self, threshold: float, alert_id: str):
+        i = bisect.bisect_right(self.thresholds, threshold)
+        self.thresholds.insert(i, threshold)
+        self.alert_ids.insert(i, alert_id)
+
+    def remove_many(self, low: float, high: float, alert_ids: set[str]):
+        """Remove `alert_ids`, whose thresholds all lie in [low, high]."""
+        lo = bisect.bisect_left(self.thresholds, low)
+        hi = bisect.bisect_right(self.thresholds, high)
+        kept = [
+            (threshold, alert_id)
+            for threshold, alert_id in zip(self.thresholds[lo:hi], self.alert_ids[lo:hi])
+            if alert_id not in alert_ids
+        ]
+        self.thresholds[lo:hi] = [threshold for threshold, _ in kept]
+        self.alert_ids[lo:hi] = [alert_id for _, alert_id in kept]
+
+    def crossed_up(self, previous: float, current: float) -> list[str]:
+        # previous < threshold <= current
+        lo = bisect.bisect_right(self.thresholds, previous)
+        hi = bisect.bisect_right(self.thresholds, current)
+        return self.alert_ids[lo:hi]
+
+    def crossed_down(self, previous: float, current: float) -> list[str]:
+        # current <= threshold < previous
+        lo = bisect.bisect_left(self.thresholds, current)
+        hi = bisect.bisect_left(self.thresholds, previous)
+        return self.alert_ids[lo:hi]
+
+
+def _boundaries(alert: Alert) -> list[tuple[str, float, str]]:
+    """(field, threshold, direction) pairs an alert is indexed under."""
+    directions = ("up", "down") if alert.direction == "both" else (alert.direction,)
+    if alert.kind == "move":
+        move = abs(alert.value)
+        return [("compare_ratio", move if direction == "up" else -move, direction) for direction in directions]
+    return [("price", alert.value, direction) for direction in directions]
+
+
+_REUTERS_CODE_RE = re.compile(r"/(?:stock|etf)/([^/?#]+)")
+
+
+def reuters_code(stock_data: NaverStockData) -> str:
+    """Reuters code of a snapshot, taken from its url ("MSFT.O" for .../stock/MSFT.O/total)."""
+    m = _REUTERS_CODE_RE.search(stock_data.url)
+    return m.group(1) if m else stock_data.symbol_code
+
+
+class AlertEngine:
+    """Evaluates price alerts against a stream of quotes.
+
+    Thresholds are kept sorted per symbol, so a tick only looks at the alerts
+    whose boundaries lie between the previous and the current value instead
+    of checking every alert. The first quote of a symbol only sets the
+    baseline and never fires.
+    """
+
+    def __init__(self, alerts: tuple[Alert, ...] = ()):
+        self._alerts: dict[str, Alert] = {}
+        self._indexes: dict[tuple[str, str, str], _BoundaryIndex] = {}
+        self._last: dict[tuple[str, str], float] = {}
+        for alert in alerts:
+            self.add(alert)
+
+    def __len__(self) -> int:
+        return len(self._alerts)
+
+    def __contains__(self, alert_id: str) -> bool:
+        return alert_id in self._alerts
+
+    @property
+    def alerts(self) -> tuple[Alert, ...]:
+        return tuple(self._alerts.values())
+
+    def add(self, alert: Alert):
+        if alert.alert_id in self._alerts:
+            self.remove(alert.alert_id)
+        self._alerts[alert.alert_id] = alert
+        for field, threshold, direction in _boundaries(alert):
+            index = self._indexes.setdefault((alert.symbol, field, direction), _BoundaryIndex())
+            index.add(threshold, alert.alert_id)
+
+    def remove(self, alert_id: str) -> Optional[Alert]:
+        alert = self._alerts.pop(alert_id, None)
+        if alert is not None:
+            self._unindex([alert])
+        return alert
+
+    def _unindex(self, alerts: list[Alert]):
+        # group by index so alerts sharing a threshold are removed in one pass
+        removals: dict[tuple[str, str, str], tuple[float, float, set[str]]] = {}
+        for alert in alerts:
+            for field, threshold, direction in _boundaries(alert):
+                key = (alert.symbol, field, direction)
+                low, high, alert_ids = removals.get(key, (threshold, threshold, set()))
+                alert_ids.add(alert.alert_id)
+                removals[key] = (min(low, threshold), max(high, threshold), alert_ids)
+
+        for key, (low, high, alert_ids) in removals.items():
+            index = self._indexes[key]
+            index.remove_many(low, high, alert_ids)
+            if not index:
+                del self._indexes[key]
+
+    def update(
+        self,
+        symbol: str,
+        price: float,
+        compare_ratio: float = math.nan,
+        stock_data: Optional[NaverStockData] = None,
+    ) -> list[AlertEvent]:
+        events: list[AlertEvent] = []
+        for field, current in (("price", price), ("compare_ratio", compare_ratio)):
+            if math.isnan(current):
+                continue
+            previous = self._last.get((symbol, field))
+            self._last[(symbol, field)] = current
+            if previous is None or previous == current:
+                continue
+
+            if current > previous:
+                index = self._indexes.get((symbol, field, "up"))
+                alert_ids = index.crossed_up(previous, current) if index else []
+            else:
+                index = self._indexes.get((symbol, field, "down"))
+                alert_ids = index.crossed_down(previous, current) if index else []
+
+            for alert_id in alert_ids:
+                events.append(AlertEvent(self._alerts[alert_id], previous, current, stock_data))
+
+        fired_once = [event.alert for event in events if event.alert.once]
+        for alert in fired_once:
+            del self._alerts[alert.alert_id]
+        self._unindex(fired_once)
+        return events
+
+    def on_quote(self, stock_data: NaverStockData) -> list[AlertEvent]:
+        return self.update(
+            reuters_code(stock_data),
+            parse_number(stock_data.close_price),
+            parse_number(stock_data.compare_ratio),
+            stock_data=stock_data,
+        )
+
+    async def run(self, quotes: AsyncIterable[NaverStockData]) -> AsyncIterator[AlertEvent]:
+        async for stock_data in quotes:
+            for event in self.on_quote(stock_data):
+                yield event
+
+    def save(self, path: Union[str, Path]):
+        # write a temp file next to it and swap it in, so a crash never leaves a partial file
+        path = Path(path)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                for alert in self._alerts.values():
+                    f.write(json.dumps(asdict(alert), ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "AlertEngine":
+        with open(path, "r") as f:
+            return cls(tuple(Alert(**json.loads(line)) for line in f if line.strip()))
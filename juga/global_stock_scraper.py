@@ -1,6 +1,5 @@
 from typing import Optional, Union
 
-import aiohttp
 from pydantic import BaseModel
 
 from juga.naver_stock_models import (
@@ -11,6 +10,7 @@ from juga.naver_stock_models import (
     NaverStockExchangeType,
 )
 from juga.stock_scraper_base import NaverStockChartURLs, NaverStockData, NaverStockScraperBase
+from juga.transport import HTTPTransport
 
 
 class NaverStockOverMarketPriceInfo(BaseModel):
@@ -113,10 +113,8 @@ class NaverStockGlobalStockScraper(NaverStockScraperBase):
             return self.ETF_URL_TEMPLATE.format(code=self.metadata.reuters_code)
         return self.STOCK_URL_TEMPLATE.format(code=self.metadata.reuters_code)
 
-    async def _fetch_stock_data_impl(self, session: aiohttp.ClientSession) -> NaverStockData:
-        json_dict = None
-        async with session.get(self._get_api_url()) as resp:
-            json_dict = await resp.json()
+    async def _fetch_stock_data_impl(self, transport: HTTPTransport) -> NaverStockData:
+        json_dict = await transport.get_json(self._get_api_url())
 
         response = GlobalStockResponse(**json_dict)
 
@@ -140,4 +138,6 @@ class NaverStockGlobalStockScraper(NaverStockScraperBase):
             total_infos=total_infos,
             chart_urls=response.image_charts,
             url=self.metadata.url,
+            local_traded_at=response.local_traded_at,
+            currency=response.currency_type.code,
         )
@@ -1,10 +1,12 @@
-import aiohttp
+import asyncio
+
 from pydantic import BaseModel
 
 from juga.naver_stock_models import (model_config, NaverStockChartURLs,
                                      NaverStockCompareToPrevious,
                                      NaverStockTradeStopType)
 from juga.stock_scraper_base import NaverStockData, NaverStockScraperBase
+from juga.transport import HTTPTransport
 
 
 class NaverKoreaStockExchangeType(BaseModel):
@@ -62,18 +64,15 @@ class NaverKoreaStockResponse(BaseModel):
 
 
 class NaverStockKoreaStockScraper(NaverStockScraperBase):
-    async def _fetch_stock_data_impl(self, session: aiohttp.ClientSession) -> NaverStockData:
+    async def _fetch_stock_data_impl(self, transport: HTTPTransport) -> NaverStockData:
         code = self.metadata.symbol_code
-        async with session.get(f"https://m.stock.naver.com/api/stock/{code}/basic") as resp:
-            resp_json = await resp.json()
+        resp_json, info_resp_json = await asyncio.gather(
+            transport.get_json(f"https://m.stock.naver.com/api/stock/{code}/basic"),
+            transport.get_json(f"https://m.stock.naver.com/api/stock/{code}/integration"),
+        )
 
         stock_resp = NaverKoreaStockResponse(**resp_json)
 
-        async with session.get(
-            f"https://m.stock.naver.com/api/stock/{code}/integration"
-        ) as resp:
-            info_resp_json = await resp.json()
-
         total_infos = {}
         market_value = ""
         for info in info_resp_json["totalInfos"]:
@@ -93,4 +92,6 @@ class NaverStockKoreaStockScraper(NaverStockScraperBase):
             total_infos=total_infos,  # TODO: ETF랑 Stock이랑 별도로 정의하면 좋겠다
             chart_urls=stock_resp.image_charts,
             url=self.metadata.url,
+            local_traded_at=stock_resp.local_traded_at,
+            currency="KRW",
         )
@@ -0,0 +1,34 @@
+import math
+from typing import Any
+
+from juga.numeric import parse_number
+from juga.transport import as_transport, TransportLike
+
+# naver quotes these currencies per 100 units
+PER_100_CURRENCIES = {"JPY", "IDR", "VND"}
+
+
+def _get_close_price(json_dict: Any, currency: str) -> str:
+    try:
+        return json_dict["exchangeInfo"]["closePrice"]
+    except (KeyError, TypeError):
+        raise ValueError(f"exchangeInfo.closePrice not found in response. currency: {currency}") from None
+
+
+class NaverFXRateScraper:
+    # reuters codes of the autoComplete `marketindicator` items, e.g. FX_USDKRW
+    URL_TEMPLATE = "https://api.stock.naver.com/marketindex/exchange/FX_{currency}KRW"
+
+    @classmethod
+    async def fetch_rate(cls, transport: TransportLike, currency: str) -> float:
+        """KRW per one unit of `currency`."""
+        if currency == "KRW":
+            return 1.0
+
+        json_dict = await as_transport(transport).get_json(cls.URL_TEMPLATE.format(currency=currency))
+        rate = parse_number(_get_close_price(json_dict, currency))
+        if math.isnan(rate):
+            raise ValueError(f"failed to parse exchange rate. currency: {currency}")
+        if currency in PER_100_CURRENCIES:
+            rate /= 100
+        return rate
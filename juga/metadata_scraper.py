@@ -1,8 +1,9 @@
 from dataclasses import dataclass, field
 
-import aiohttp
 from pydantic import BaseModel, ConfigDict
 
+from juga.transport import as_transport, TransportLike
+
 
 @dataclass
 class NaverStockMetadata:
@@ -63,10 +64,8 @@ class NaverStockMetadataScraper:
     URL_TEMPLATE = "https://m.stock.naver.com/front-api/search/autoComplete?query={query}&target=stock%2Cindex%2Cmarketindicator%2Ccoin"  # noqa: E501
 
     @classmethod
-    async def fetch_metadata(cls, session: aiohttp.ClientSession, query: str) -> tuple[NaverStockMetadata, ...]:
-        json_dict = None
-        async with session.get(cls.URL_TEMPLATE.format(query=query)) as resp:
-            json_dict = await resp.json(content_type=None)
+    async def fetch_metadata(cls, transport: TransportLike, query: str) -> tuple[NaverStockMetadata, ...]:
+        json_dict = await as_transport(transport).get_json(cls.URL_TEMPLATE.format(query=query))
 
         response = NaverStockAutoCompleteResponse(**json_dict)
         # TODO: check response.is_success
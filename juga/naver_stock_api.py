@@ -1,13 +1,20 @@
-from typing import Tuple, Type, TypeVar
+import asyncio
+import logging
+from typing import AsyncIterator, Optional, Sequence, Tuple, Type, TypeVar
 
-import aiohttp
 from asyncache import cached
 from cachetools import LRUCache
+from cachetools.keys import hashkey
 
 from juga.global_stock_scraper import NaverStockGlobalStockScraper
 from juga.korea_stock_scraper import NaverStockKoreaStockScraper
 from juga.metadata_scraper import NaverStockMetadata, NaverStockMetadataScraper
+from juga.shared_cache import SharedCache
 from juga.stock_scraper_base import NaverStockData
+from juga.tick_archive import TickArchive
+from juga.transport import AiohttpTransport, HTTPTransport
+
+logger = logging.getLogger(__name__)
 
 
 class InvalidStockQuery(Exception):
@@ -27,24 +34,84 @@ T = TypeVar("T", bound="NaverStockAPI")
 
 
 class NaverStockAPI:
+    """Entry point for fetching stock data.
+
+    Pass a shared `HTTPTransport` (e.g. `HTTPXTransport` for HTTP/2) to reuse
+    connections across calls. Without one, every call opens and closes its own
+    aiohttp session.
+
+    Set `NaverStockAPI.shared_cache` to a `SharedCache` to share metadata and
+    stock data between worker processes, and `NaverStockAPI.tick_archive` to a
+    `TickArchive` to record every fetched snapshot.
+    """
+
+    shared_cache: Optional[SharedCache] = None
+    tick_archive: Optional[TickArchive] = None
+
     @classmethod
-    async def from_query(cls: Type[T], query: str) -> T:
-        metadata = (await cls.fetch_metadata(query))
+    async def from_query(cls: Type[T], query: str, transport: Optional[HTTPTransport] = None) -> T:
+        metadata = (await cls.fetch_metadata(query, transport=transport))
         if not metadata:
             raise InvalidStockQuery(f"failed to find stock. query: {query}")
         # pick first one
-        return cls(metadata[0])
+        return cls(metadata[0], transport=transport)
 
     @classmethod
-    @cached(LRUCache(maxsize=20))
-    async def fetch_metadata(cls, query: str) -> Tuple[NaverStockMetadata, ...]:
-        async with aiohttp.ClientSession() as session:
-            return await NaverStockMetadataScraper.fetch_metadata(session=session, query=query)
+    # metadata does not depend on which transport fetched it
+    @cached(LRUCache(maxsize=20), key=lambda cls, query, transport=None: hashkey(cls, query))
+    async def fetch_metadata(
+        cls, query: str, transport: Optional[HTTPTransport] = None
+    ) -> Tuple[NaverStockMetadata, ...]:
+        if cls.shared_cache is not None:
+            return await cls.shared_cache.fetch_metadata(query, lambda: cls._fetch_metadata(query, transport))
+        return await cls._fetch_metadata(query, transport)
 
-    def __init__(self, metadata: NaverStockMetadata):
+    @classmethod
+    async def _fetch_metadata(
+        cls, query: str, transport: Optional[HTTPTransport] = None
+    ) -> Tuple[NaverStockMetadata, ...]:
+        if transport is not None:
+            return await NaverStockMetadataScraper.fetch_metadata(transport=transport, query=query)
+        async with AiohttpTransport() as transport:
+            return await NaverStockMetadataScraper.fetch_metadata(transport=transport, query=query)
+
+    def __init__(self, metadata: NaverStockMetadata, transport: Optional[HTTPTransport] = None):
         self.metadata = metadata
         self.parser = NaverStockScraperFactory.from_metadata(metadata)
+        self.transport = transport
 
     async def fetch_stock_data(self) -> NaverStockData:
-        async with aiohttp.ClientSession() as session:
-            return await self.parser.fetch_stock_data(session)
+        if self.shared_cache is not None:
+            stock_data = await self.shared_cache.fetch_stock_data(self.metadata, self._fetch_stock_data)
+        else:
+            stock_data = await self._fetch_stock_data()
+        if self.tick_archive is not None:
+            # a flush compresses, waits for the file lock and writes, keep it off the event loop
+            await asyncio.to_thread(self.tick_archive.append, stock_data)
+        return stock_data
+
+    async def _fetch_stock_data(self) -> NaverStockData:
+        if self.transport is not None:
+            return await self.parser.fetch_stock_data(self.transport)
+        async with AiohttpTransport() as transport:
+            return await self.parser.fetch_stock_data(transport)
+
+
+async def stream_stock_data(apis: Sequence[NaverStockAPI], interval: float) -> AsyncIterator[NaverStockData]:
+    """Poll every api each `interval` seconds and yield the snapshots as they arrive.
+
+    A failed fetch is logged and skipped for that round, so one bad ticker
+    doesn't end the stream.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        started = loop.time()
+        results = await asyncio.gather(*(api.fetch_stock_data() for api in apis), return_exceptions=True)
+        for api, result in zip(apis, results):
+            if isinstance(result, Exception):
+                logger.warning("failed to fetch %s", api.metadata.reuters_code, exc_info=result)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                yield result
+        await asyncio.sleep(max(0.0, interval - (loop.time() - started)))
@@ -0,0 +1,32 @@
+import math
+import re
+
+# longer units first so "백만" is not read as "만"
+KOREAN_UNITS = {"조": 1e12, "억": 1e8, "백만": 1e6, "만": 1e4}
+
+_NUMBER_RE = re.compile(r"[-+]?\d+(?:\.\d+)?")
+_UNIT_RE = re.compile(r"([-+]?\d+(?:\.\d+)?)\s*(조|억|백만|만)")
+
+
+def parse_number(text) -> float:
+    """Parse a naver formatted number into a float. Returns nan if it is not one.
+
+    Handles thousands separators, the "🔺" marker, "%"/"배"/currency suffixes
+    and korean units, e.g. "34조 6,144억" -> 3.46144e14, "442,787백만" -> 4.42787e11.
+    """
+    if text is None:
+        return math.nan
+    if isinstance(text, (int, float)):
+        return float(text)
+
+    text = text.replace(",", "").replace("🔺", "").strip()
+    if any(unit in text for unit in KOREAN_UNITS):
+        sign = -1.0 if text.startswith("-") else 1.0
+        total = sum(abs(float(value)) * KOREAN_UNITS[unit] for value, unit in _UNIT_RE.findall(text))
+        return sign * total if total else math.nan
+
+    numbers = _NUMBER_RE.findall(text)
+    # dates like "2023.09.14." or ranges are not a single number
+    if len(numbers) != 1 or text.count(".") > 1:
+        return math.nan
+    return float(numbers[0])
@@ -0,0 +1,225 @@
+import asyncio
+import math
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional, Sequence
+
+from cachetools import TTLCache
+
+from juga.market_index_scraper import NaverFXRateScraper
+from juga.naver_stock_api import NaverStockAPI
+from juga.numeric import parse_number
+from juga.stock_scraper_base import NaverStockData
+from juga.transport import AiohttpTransport, HTTPTransport
+
+# currency -> KRW per one unit of it
+FXRateFetcher = Callable[[str], Awaitable[float]]
+
+
+class FXRateCache:
+    """Exchange rates (KRW per unit) cached with their own TTL.
+
+    Concurrent lookups of the same currency share one fetch.
+    """
+
+    def __init__(self, fetch: FXRateFetcher, ttl: float = 60.0, maxsize: int = 64):
+        self.fetch = fetch
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    async def get(self, currency: str) -> float:
+        if currency == "KRW":
+            return 1.0
+        rate = self._cache.get(currency)
+        if rate is not None:
+            return rate
+
+        future = self._inflight.get(currency)
+        if future is None:
+            future = asyncio.ensure_future(self.fetch(currency))
+            self._inflight[currency] = future
+            future.add_done_callback(lambda _: self._inflight.pop(currency, None))
+        rate = await asyncio.shield(future)
+        self._cache[currency] = rate
+        return rate
+
+
+@dataclass(frozen=True)
+class Holding:
+    query: str  # ticker or name, resolved with `NaverStockAPI.from_query`
+    quantity: float
+
+
+@dataclass(frozen=True)
+class PositionValuation:
+    holding: Holding
+    symbol: str
+    currency: str
+    price: float  # nan if no quote could be parsed
+    market_value: float  # in `currency`
+    base_value: float  # in the portfolio's base currency
+
+    @property
+    def missing(self) -> bool:
+        return math.isnan(self.price)
+
+
+@dataclass(frozen=True)
+class PortfolioValuation:
+    base_currency: str
+    total: float
+    subtotals: dict[str, float]  # market value per currency, in that currency
+    fx_rates: dict[str, float]  # base currency per unit of each currency
+    positions: tuple[PositionValuation, ...]
+    missing: tuple[str, ...] = ()  # symbols without a price, left out of the totals
+
+
+class Portfolio:
+    """Values a list of KRW/foreign holdings in one base currency.
+
+    `refresh()` resolves the holdings and fetches every quote and the needed
+    exchange rates concurrently. After that, `on_quote()` and `on_fx_rate()`
+    adjust the running totals by the change of a single position or currency
+    instead of revaluing the whole portfolio.
+
+    Pass one `FXRateCache` as `fx_rates` to share exchange rates between
+    portfolios (e.g. one per page view); `fx_ttl` and `fx_fetcher` are then
+    unused.
+
+    Positions whose price can't be parsed are reported as missing and left
+    out of the totals until a quote with a price arrives.
+    """
+
+    def __init__(
+        self,
+        holdings: Sequence[Holding],
+        base_currency: str = "KRW",
+        fx_ttl: float = 60.0,
+        transport: Optional[HTTPTransport] = None,
+        fx_fetcher: Optional[FXRateFetcher] = None,
+        fx_rates: Optional[FXRateCache] = None,
+    ):
+        self.holdings = tuple(holdings)
+        self.base_currency = base_currency
+        self.transport = transport
+        self.fx_rates = fx_rates or FXRateCache(fx_fetcher or self._fetch_fx_rate, ttl=fx_ttl)
+        self.apis: Optional[tuple[NaverStockAPI, ...]] = None
+
+        self._by_symbol: dict[str, list[int]] = {}
+        self._symbols: list[str] = []
+        self._currencies: list[str] = []
+        self._prices: list[float] = []
+        self._subtotals: dict[str, float] = {}
+        self._krw_rates: dict[str, float] = {"KRW": 1.0}
+        self._total_krw = 0.0
+
+    async def _fetch_fx_rate(self, currency: str) -> float:
+        if self.transport is not None:
+            return await NaverFXRateScraper.fetch_rate(self.transport, currency)
+        async with AiohttpTransport() as transport:
+            return await NaverFXRateScraper.fetch_rate(transport, currency)
+
+    async def resolve(self) -> tuple[NaverStockAPI, ...]:
+        if self.apis is None:
+            self.apis = tuple(
+                await asyncio.gather(
+                    *(NaverStockAPI.from_query(holding.query, transport=self.transport) for holding in self.holdings)
+                )
+            )
+        return self.apis
+
+    async def refresh(self) -> PortfolioValuation:
+        apis = await self.resolve()
+
+        # holdings of the same stock share one quote
+        unique_apis = {api.metadata.url: api for api in apis}
+        quotes = dict(
+            zip(unique_apis, await asyncio.gather(*(api.fetch_stock_data() for api in unique_apis.values())))
+        )
+        stock_datas = [quotes[api.metadata.url] for api in apis]
+
+        currencies = {stock_data.currency or "KRW" for stock_data in stock_datas} | {self.base_currency}
+        rates = await asyncio.gather(*(self.fx_rates.get(currency) for currency in currencies))
+
+        self._by_symbol = {}
+        for i, stock_data in enumerate(stock_datas):
+            self._by_symbol.setdefault(stock_data.symbol_code, []).append(i)
+        self._symbols = [stock_data.symbol_code for stock_data in stock_datas]
+        self._currencies = [stock_data.currency or "KRW" for stock_data in stock_datas]
+        self._prices = [parse_number(stock_data.close_price) for stock_data in stock_datas]
+        self._krw_rates = dict(zip(currencies, rates))
+        self._recompute()
+        return self.valuation()
+
+    async def refresh_fx_rates(self) -> float:
+        """Re-read the exchange rates (fetching the expired ones) and return the new total."""
+        currencies = list(self._krw_rates)
+        for currency, rate in zip(currencies, await asyncio.gather(*map(self.fx_rates.get, currencies))):
+            self.on_fx_rate(currency, rate)
+        return self.total
+
+    def _recompute(self):
+        self._subtotals = {currency: 0.0 for currency in self._krw_rates}
+        for holding, currency, price in zip(self.holdings, self._currencies, self._prices):
+            self._subtotals[currency] += _market_value(holding, price)
+        self._total_krw = sum(subtotal * self._krw_rates[currency] for currency, subtotal in self._subtotals.items())
+
+    @property
+    def total(self) -> float:
+        base_rate = self._krw_rates.get(self.base_currency)
+        # not refreshed yet
+        if base_rate is None:
+            return 0.0
+        return self._total_krw / base_rate
+
+    def on_quote(self, stock_data: NaverStockData) -> float:
+        """Apply a new quote and return the new total.
+
+        A quote without a parsable price keeps the last known one.
+        """
+        price = parse_number(stock_data.close_price)
+        if math.isnan(price):
+            return self.total
+        for i in self._by_symbol.get(stock_data.symbol_code, ()):
+            holding = self.holdings[i]
+            delta = _market_value(holding, price) - _market_value(holding, self._prices[i])
+            currency = self._currencies[i]
+            self._prices[i] = price
+            self._subtotals[currency] += delta
+            self._total_krw += delta * self._krw_rates[currency]
+        return self.total
+
+    def on_fx_rate(self, currency: str, krw_rate: float) -> float:
+        """Apply a new exchange rate (KRW per unit of `currency`) and return the new total."""
+        if currency not in self._krw_rates:
+            return self.total
+        self._total_krw += self._subtotals.get(currency, 0.0) * (krw_rate - self._krw_rates[currency])
+        self._krw_rates[currency] = krw_rate
+        return self.total
+
+    def valuation(self) -> PortfolioValuation:
+        base_rate = self._krw_rates.get(self.base_currency, math.nan)
+        fx_rates = {currency: rate / base_rate for currency, rate in self._krw_rates.items()}
+        positions = tuple(
+            PositionValuation(
+                holding=holding,
+                symbol=symbol,
+                currency=currency,
+                price=price,
+                market_value=holding.quantity * price,
+                base_value=holding.quantity * price * fx_rates[currency],
+            )
+            for holding, symbol, currency, price in zip(self.holdings, self._symbols, self._currencies, self._prices)
+        )
+        return PortfolioValuation(
+            base_currency=self.base_currency,
+            total=self.total,
+            subtotals=dict(self._subtotals),
+            fx_rates=fx_rates,
+            positions=positions,
+            missing=tuple(position.symbol for position in positions if position.missing),
+        )
+
+
+def _market_value(holding: Holding, price: float) -> float:
+    # positions without a price don't count towards the totals
+    return 0.0 if math.isnan(price) else holding.quantity * price
@@ -0,0 +1,282 @@
+import operator
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Optional, Sequence, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from juga.numeric import parse_number
+from juga.stock_scraper_base import NaverStockData
+
+
+class InvalidScreenerQuery(Exception):
+    pass
+
+
+# NaverStockData attributes usable as fields, next to every `total_infos` key
+BUILTIN_FIELDS = ("close_price", "compare_price", "compare_ratio", "market_value")
+
+COMPARISON_OPS: dict[str, Callable[[np.ndarray, float], np.ndarray]] = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "=": operator.eq,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+KEYWORDS = {"and", "or", "not", "order", "by", "asc", "desc", "limit"}
+
+_TOKEN_RE = re.compile(
+    r"""
+    \s*(?:
+        (?P<string>"[^"]*"|`[^`]*`)
+      | (?P<op><=|>=|!=|==|<|>|=)
+      | (?P<punct>[(),])
+      | (?P<number>[-+]?\d[\d,]*(?:\.\d+)?(?:%|배)?)(?![^\s<>=!(),"`])
+      | (?P<word>[^\s<>=!(),"`]+)
+    )""",
+    re.VERBOSE,
+)
+
+
+@dataclass(frozen=True)
+class Comparison:
+    field: str
+    op: str
+    value: float
+
+
+@dataclass(frozen=True)
+class BoolOp:
+    op: str  # "and", "or"
+    operands: tuple["Condition", ...]
+
+
+@dataclass(frozen=True)
+class Not:
+    operand: "Condition"
+
+
+Condition = Union[Comparison, BoolOp, Not]
+
+
+@dataclass(frozen=True)
+class ScreenerQuery:
+    """Parsed form of a screener expression.
+
+    grammar::
+
+        query   := [condition] ["order by" field ["asc"|"desc"] ("," ...)*] ["limit" N]
+        condition := condition "or" condition | condition "and" condition
+                   | "not" condition | "(" condition ")" | field op number
+
+    Fields containing spaces are quoted, e.g. `"52주 최고" > 300`. Numbers may
+    carry a `%` or `배` suffix, which is ignored (`배당수익률 > 3%`).
+    """
+
+    condition: Optional[Condition]
+    order_by: tuple[tuple[str, bool], ...]  # (field, descending)
+    limit: Optional[int]
+
+    @property
+    def fields(self) -> set[str]:
+        fields = {field for field, _ in self.order_by}
+        stack = [self.condition] if self.condition is not None else []
+        while stack:
+            node = stack.pop()
+            if isinstance(node, Comparison):
+                fields.add(node.field)
+            elif isinstance(node, BoolOp):
+                stack.extend(node.operands)
+            else:
+                stack.append(node.operand)
+        return fields
+
+    @classmethod
+    @lru_cache(maxsize=128)
+    def parse(cls, text: str) -> "ScreenerQuery":
+        return _Parser(text).parse()
+
+
+class _Parser:
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens = self._tokenize(text)
+        self.pos = 0
+
+    def _tokenize(self, text: str) -> list[tuple[str, str]]:
+        tokens = []
+        pos = 0
+        text = text.rstrip()
+        while pos < len(text):
+            m = _TOKEN_RE.match(text, pos)
+            if m is None:
+                raise InvalidScreenerQuery(f"unexpected character at {pos}: {text!r}")
+            kind = m.lastgroup
+            assert kind is not None  # every alternative of _TOKEN_RE is a named group
+            value = m.group(kind)
+            if kind == "string":
+                kind, value = "field", value[1:-1]
+            elif kind == "word":
+                kind = "keyword" if value.lower() in KEYWORDS else "field"
+                value = value.lower() if kind == "keyword" else value
+            tokens.append((kind, value))
+            pos = m.end()
+        return tokens
+
+    def _peek(self) -> Optional[tuple[str, str]]:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def _accept(self, kind: str, value: Optional[str] = None) -> Optional[str]:
+        token = self._peek()
+        if token is not None and token[0] == kind and (value is None or token[1] == value):
+            self.pos += 1
+            return token[1]
+        return None
+
+    def _expect(self, kind: str, value: Optional[str] = None) -> str:
+        token = self._accept(kind, value)
+        if token is None:
+            found = self._peek()
+            raise InvalidScreenerQuery(
+                f"expected {value or kind}, found {found[1] if found else 'end of query'}: {self.text!r}"
+            )
+        return token
+
+    def parse(self) -> ScreenerQuery:
+        condition = None
+        if self._peek() is not None and self._peek() not in (("keyword", "order"), ("keyword", "limit")):
+            condition = self._or()
+
+        order_by = []
+        if self._accept("keyword", "order"):
+            self._expect("keyword", "by")
+            while True:
+                field = self._expect("field")
+                descending = bool(self._accept("keyword", "desc"))
+                if not descending:
+                    self._accept("keyword", "asc")
+                order_by.append((field, descending))
+                if not self._accept("punct", ","):
+                    break
+
+        limit = None
+        if self._accept("keyword", "limit"):
+            limit = int(parse_number(self._expect("number")))
+
+        token = self._peek()
+        if token is not None:
+            raise InvalidScreenerQuery(f"unexpected token {token[1]!r}: {self.text!r}")
+        return ScreenerQuery(condition=condition, order_by=tuple(order_by), limit=limit)
+
+    def _or(self) -> Condition:
+        operands = [self._and()]
+        while self._accept("keyword", "or"):
+            operands.append(self._and())
+        return operands[0] if len(operands) == 1 else BoolOp("or", tuple(operands))
+
+    def _and(self) -> Condition:
+        operands = [self._not()]
+        while self._accept("keyword", "and"):
+            operands.append(self._not())
+        return operands[0] if len(operands) == 1 else BoolOp("and", tuple(operands))
+
+    def _not(self) -> Condition:
+        if self._accept("keyword", "not"):
+            return Not(self._not())
+        if self._accept("punct", "("):
+            condition = self._or()
+            self._expect("punct", ")")
+            return condition
+        field = self._expect("field")
+        op = self._expect("op")
+        value = parse_number(self._expect("number"))
+        return Comparison(field, op, value)
+
+
+def field_value(stock_data: NaverStockData, field: str) -> Optional[str]:
+    if field in BUILTIN_FIELDS:
+        return getattr(stock_data, field)
+    return stock_data.total_infos.get(field)
+
+
+class Screener:
+    """Vectorized screener over a batch of `NaverStockData` snapshots.
+
+    Fields are parsed into float64 columns the first time a query uses them
+    (missing or non numeric values become nan, which fails every comparison
+    and its negation), so repeated queries over the same batch only run numpy
+    operations.
+    """
+
+    def __init__(self, snapshots: Sequence[NaverStockData]):
+        self.snapshots = list(snapshots)
+        self._columns: dict[str, np.ndarray] = {}
+        self._known_fields = set(BUILTIN_FIELDS)
+        for snapshot in self.snapshots:
+            self._known_fields.update(snapshot.total_infos)
+
+    def __len__(self) -> int:
+        return len(self.snapshots)
+
+    def column(self, field: str) -> np.ndarray:
+        if field not in self._known_fields:
+            raise InvalidScreenerQuery(f"unknown field: {field}")
+        if field not in self._columns:
+            self._columns[field] = np.fromiter(
+                (parse_number(field_value(snapshot, field)) for snapshot in self.snapshots),
+                dtype=np.float64,
+                count=len(self.snapshots),
+            )
+        return self._columns[field]
+
+    def _mask(self, condition: Condition) -> tuple[npt.NDArray[np.bool_], npt.NDArray[np.bool_]]:
+        """(is true, is false) masks. Rows in neither are unknown, like NULL in SQL."""
+        if isinstance(condition, Comparison):
+            if condition.op not in COMPARISON_OPS:
+                raise InvalidScreenerQuery(f"unknown operator: {condition.op}")
+            column = self.column(condition.field)
+            # nan fails every comparison, including "!=", and its negation
+            known = ~np.isnan(column)
+            result = COMPARISON_OPS[condition.op](column, condition.value)
+            return result & known, ~result & known
+        if isinstance(condition, Not):
+            is_true, is_false = self._mask(condition.operand)
+            return is_false, is_true
+        masks = [self._mask(operand) for operand in condition.operands]
+        trues = np.array([is_true for is_true, _ in masks])
+        falses = np.array([is_false for _, is_false in masks])
+        if condition.op == "and":
+            return np.logical_and.reduce(trues), np.logical_or.reduce(falses)
+        return np.logical_or.reduce(trues), np.logical_and.reduce(falses)
+
+    def screen_indices(self, query: Union[str, ScreenerQuery]) -> np.ndarray:
+        if isinstance(query, str):
+            query = ScreenerQuery.parse(query)
+
+        if not self.snapshots:
+            return np.arange(0)
+        if query.condition is None:
+            indices = np.arange(len(self.snapshots))
+        else:
+            indices = np.flatnonzero(self._mask(query.condition)[0])
+
+        if query.order_by:
+            # np.lexsort sorts by the last key first. nan goes last either way
+            keys = []
+            for field, descending in reversed(query.order_by):
+                values = self.column(field)[indices]
+                values = -values if descending else values
+                keys.append(np.where(np.isnan(values), np.inf, values))
+            indices = indices[np.lexsort(keys)]
+
+        if query.limit is not None:
+            indices = indices[: query.limit]
+        return indices
+
+    def screen(self, query: Union[str, ScreenerQuery]) -> list[NaverStockData]:
+        return [self.snapshots[i] for i in self.screen_indices(query)]
@@ -0,0 +1,245 @@
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABCMeta, abstractmethod
+from dataclasses import asdict, fields
+from typing import Any, Awaitable, Callable, Optional
+
+from juga.metadata_scraper import NaverStockMetadata
+from juga.naver_stock_models import NaverStockChartURLs
+from juga.stock_scraper_base import NaverStockData
+
+
+class SharedCacheBackend(metaclass=ABCMeta):
+    """Key/value store shared between worker processes.
+
+    Besides plain get/set with a TTL, backends provide a short-lived lock per
+    key so only one worker refreshes a stale entry at a time. Methods may
+    block; `SharedCache` calls them from worker threads, so they must be
+    thread safe.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        pass
+
+    @abstractmethod
+    def acquire_lock(self, key: str, ttl: float) -> bool:
+        pass
+
+    @abstractmethod
+    def release_lock(self, key: str) -> None:
+        pass
+
+
+class SQLiteCacheBackend(SharedCacheBackend):
+    """SQLite (WAL mode) backend for workers on the same host.
+
+    Each thread uses its own connection. `close()` closes the connections
+    of all threads, which reconnect on their next call.
+    """
+
+    PURGE_INTERVAL = 256
+
+    def __init__(self, path: str, timeout: float = 5.0):
+        self.path = path
+        self.timeout = timeout
+        self.owner = uuid.uuid4().hex
+        self._local = threading.local()
+        self._sets = 0
+        # (pid, connection) of every thread, so close() can reach the pool threads' connections
+        self._conns: list[tuple[int, sqlite3.Connection]] = []
+        self._conns_lock = threading.Lock()
+        self._generation = 0
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        local = self._local
+        # connections must not be shared across fork (e.g. gunicorn --preload)
+        if getattr(local, "conn", None) is None or local.pid != os.getpid() or local.generation != self._generation:
+            # only used by this thread, but closed from whichever thread calls close()
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB, expires_at REAL)")
+            conn.execute("CREATE TABLE IF NOT EXISTS locks (key TEXT PRIMARY KEY, owner TEXT, expires_at REAL)")
+            local.conn = conn
+            local.pid = os.getpid()
+            local.generation = self._generation
+            with self._conns_lock:
+                self._conns.append((local.pid, conn))
+        return local.conn
+
+    def get(self, key: str) -> Optional[bytes]:
+        row = self.conn.execute(
+            "SELECT value FROM cache WHERE key = ? AND expires_at > ?", (key, time.time())
+        ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        now = time.time()
+        self.conn.execute(
+            "INSERT INTO cache (key, value, expires_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value, expires_at = excluded.expires_at",
+            (key, value, now + ttl),
+        )
+        self._sets += 1
+        if self._sets % self.PURGE_INTERVAL == 0:
+            self.conn.execute("DELETE FROM cache WHERE expires_at <= ?", (now,))
+
+    def acquire_lock(self, key: str, ttl: float) -> bool:
+        now = time.time()
+        cursor = self.conn.execute(
+            "INSERT INTO locks (key, owner, expires_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at "
+            "WHERE locks.expires_at <= ?",
+            (key, self.owner, now + ttl, now),
+        )
+        return cursor.rowcount == 1
+
+    def release_lock(self, key: str) -> None:
+        self.conn.execute("DELETE FROM locks WHERE key = ? AND owner = ?", (key, self.owner))
+
+    def close(self) -> None:
+        """Close the connections opened by every thread of this process."""
+        with self._conns_lock:
+            conns, self._conns = self._conns, []
+            self._generation += 1
+        pid = os.getpid()
+        for conn_pid, conn in conns:
+            # connections inherited across fork belong to the parent
+            if conn_pid == pid:
+                conn.close()
+        self._local.conn = None
+
+
+class RedisCacheBackend(SharedCacheBackend):
+    """Backend for any redis-py compatible (sync) client.
+
+    Only `get`, `set(..., nx=, px=)` and `delete` are used, so lightweight
+    Redis-compatible servers work as well.
+    """
+
+    def __init__(self, client: Any, prefix: str = "juga:"):
+        self.client = client
+        self.prefix = prefix
+        self.owner = uuid.uuid4().hex.encode()
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(self.prefix + key)
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self.client.set(self.prefix + key, value, px=int(ttl * 1000))
+
+    def acquire_lock(self, key: str, ttl: float) -> bool:
+        return bool(self.client.set(self.prefix + "lock:" + key, self.owner, nx=True, px=int(ttl * 1000)))
+
+    def release_lock(self, key: str) -> None:
+        lock_key = self.prefix + "lock:" + key
+        # not atomic, but the lock ttl bounds the damage of a lost race
+        if self.client.get(lock_key) == self.owner:
+            self.client.delete(lock_key)
+
+
+def dump_metadata(metadata: tuple[NaverStockMetadata, ...]) -> bytes:
+    init_fields = [f.name for f in fields(NaverStockMetadata) if f.init]
+    return json.dumps([{name: asdict(md)[name] for name in init_fields} for md in metadata]).encode()
+
+
+def load_metadata(raw: bytes) -> tuple[NaverStockMetadata, ...]:
+    return tuple(NaverStockMetadata(**item) for item in json.loads(raw))
+
+
+def dump_stock_data(stock_data: NaverStockData) -> bytes:
+    return stock_data.model_dump_json(by_alias=True).encode()
+
+
+def load_stock_data(raw: bytes) -> NaverStockData:
+    # NaverStockData.__init__ decorates compare_price/compare_ratio, so rebuild
+    # the cached (already decorated) snapshot without running it again
+    data = json.loads(raw)
+    data["chart_urls"] = NaverStockChartURLs.model_validate(data["chart_urls"])
+    return NaverStockData.model_construct(**data)
+
+
+class SharedCache:
+    """Cross-process cache for metadata and `NaverStockData` snapshots.
+
+    Fresh entries written by one worker are served to every other worker
+    using the same backend. When an entry is missing, exactly one worker
+    fetches it while the others wait for the result to appear.
+
+    Backend calls run in a thread so a busy backend (e.g. sqlite waiting on
+    a write lock) does not stall the event loop.
+    """
+
+    def __init__(
+        self,
+        backend: SharedCacheBackend,
+        metadata_ttl: float = 3600.0,
+        stock_data_ttl: float = 10.0,
+        lock_ttl: float = 10.0,
+        poll_interval: float = 0.05,
+    ):
+        self.backend = backend
+        self.metadata_ttl = metadata_ttl
+        self.stock_data_ttl = stock_data_ttl
+        self.lock_ttl = lock_ttl
+        self.poll_interval = poll_interval
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    async def get_or_fetch(self, key: str, fetch: Callable[[], Awaitable[bytes]], ttl: float) -> bytes:
+        value = await asyncio.to_thread(self.backend.get, key)
+        if value is not None:
+            return value
+
+        # coroutines of the same worker share a single lookup
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._fetch_once(key, fetch, ttl))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(future)
+
+    async def _fetch_once(self, key: str, fetch: Callable[[], Awaitable[bytes]], ttl: float) -> bytes:
+        while True:
+            if await asyncio.to_thread(self.backend.acquire_lock, key, self.lock_ttl):
+                try:
+                    # another worker may have refreshed it before we got the lock
+                    value = await asyncio.to_thread(self.backend.get, key)
+                    if value is None:
+                        value = await fetch()
+                        await asyncio.to_thread(self.backend.set, key, value, ttl)
+                    return value
+                finally:
+                    await asyncio.to_thread(self.backend.release_lock, key)
+
+            # the lock holder refreshes the entry. if it dies, its lock expires
+            await asyncio.sleep(self.poll_interval)
+            value = await asyncio.to_thread(self.backend.get, key)
+            if value is not None:
+                return value
+
+    async def fetch_metadata(
+        self, query: str, fetch: Callable[[], Awaitable[tuple[NaverStockMetadata, ...]]]
+    ) -> tuple[NaverStockMetadata, ...]:
+        async def _fetch() -> bytes:
+            return dump_metadata(await fetch())
+
+        return load_metadata(await self.get_or_fetch(f"metadata:{query}", _fetch, self.metadata_ttl))
+
+    async def fetch_stock_data(
+        self, metadata: NaverStockMetadata, fetch: Callable[[], Awaitable[NaverStockData]]
+    ) -> NaverStockData:
+        async def _fetch() -> bytes:
+            return dump_stock_data(await fetch())
+
+        return load_stock_data(await self.get_or_fetch(f"stock:{metadata.url}", _fetch, self.stock_data_ttl))
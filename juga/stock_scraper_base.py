@@ -1,11 +1,11 @@
 from abc import ABCMeta, abstractmethod
 from typing import Optional
 
-import aiohttp
 from pydantic import BaseModel
 
 from juga.metadata_scraper import NaverStockMetadata
 from juga.naver_stock_models import NaverStockChartURLs
+from juga.transport import as_transport, HTTPTransport, TransportLike
 
 
 class NaverStockData(BaseModel):
@@ -20,6 +20,8 @@ class NaverStockData(BaseModel):
     total_infos: dict[str, Optional[str]]  # TODO: ETF랑 Stock이랑 별도로 정의하면 좋겠다
     chart_urls: NaverStockChartURLs
     url: str
+    local_traded_at: Optional[str] = None  # "2023-08-25T16:10:58+09:00"
+    currency: Optional[str] = None  # "KRW", "USD"
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -35,11 +37,11 @@ class NaverStockScraperBase(metaclass=ABCMeta):
         self.metadata = stock_metadata
 
     @abstractmethod
-    async def _fetch_stock_data_impl(self, session: aiohttp.ClientSession) -> NaverStockData:
+    async def _fetch_stock_data_impl(self, transport: HTTPTransport) -> NaverStockData:
         pass
 
-    async def fetch_stock_data(self, session: aiohttp.ClientSession) -> NaverStockData:
-        stock_data = await self._fetch_stock_data_impl(session)
+    async def fetch_stock_data(self, transport: TransportLike) -> NaverStockData:
+        stock_data = await self._fetch_stock_data_impl(as_transport(transport))
         stock_data.url = self.metadata.url
         # workaround for broken korea stock market link
         stock_data.url = stock_data.url.replace("main.nhn", "index.nhn")
@@ -0,0 +1,278 @@
+import atexit
+import mmap
+import re
+import sys
+import threading
+import time
+import weakref
+import zlib
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+
+from juga.numeric import parse_number
+from juga.stock_scraper_base import NaverStockData
+
+if sys.platform != "win32":
+    import fcntl
+
+# prices are stored as fixed point integers
+PRICE_SCALE = 10_000
+
+TICK_DTYPE = np.dtype([("ts", "datetime64[ms]"), ("price", "<f8"), ("compare", "<f8"), ("volume", "<i8")])
+
+# one entry per compressed block, appended after the block itself is written
+INDEX_DTYPE = np.dtype(
+    [("first_ts", "<i8"), ("last_ts", "<i8"), ("offset", "<i8"), ("length", "<i8"), ("count", "<i8")]
+)
+
+_N_COLUMNS = 4  # ts(ms), price, compare, volume
+
+
+def _encode_block(columns: np.ndarray) -> bytes:
+    # delta encode each column, then shuffle bytes so the mostly zero high
+    # bytes of the small deltas end up next to each other before zlib
+    deltas = np.ascontiguousarray(np.diff(columns, axis=1, prepend=0), dtype="<i8")
+    shuffled = deltas.view(np.uint8).reshape(_N_COLUMNS, -1, 8).transpose(0, 2, 1)
+    return zlib.compress(np.ascontiguousarray(shuffled).tobytes(), 6)
+
+
+def _decode_block(raw: bytes, count: int) -> np.ndarray:
+    shuffled = np.frombuffer(zlib.decompress(raw), dtype=np.uint8).reshape(_N_COLUMNS, 8, count)
+    deltas = np.ascontiguousarray(shuffled.transpose(0, 2, 1)).view("<i8").reshape(_N_COLUMNS, count)
+    return np.cumsum(deltas, axis=1)
+
+
+def _fixed(value: float, scale: int) -> int:
+    return 0 if np.isnan(value) else int(round(value * scale))
+
+
+def _to_epoch_ms(timestamp: datetime) -> int:
+    if timestamp.tzinfo is None:
+        raise ValueError(f"timezone aware datetime required: {timestamp}")
+    return int(timestamp.timestamp() * 1000)
+
+
+def _last_indexed_ts(index_file) -> int:
+    # drop a partially written trailing index entry left by a crashed writer
+    n_blocks = index_file.seek(0, 2) // INDEX_DTYPE.itemsize
+    index_file.truncate(n_blocks * INDEX_DTYPE.itemsize)
+    if n_blocks == 0:
+        return -1
+    with open(index_file.name, "rb") as f:
+        f.seek((n_blocks - 1) * INDEX_DTYPE.itemsize)
+        return int(np.frombuffer(f.read(INDEX_DTYPE.itemsize), dtype=INDEX_DTYPE)["last_ts"][0])
+
+
+def _close_at_exit(ref: "weakref.ref[TickArchive]"):
+    archive = ref()
+    if archive is not None:
+        archive.close()
+
+
+class TickSegment:
+    """Read side of one day/symbol segment.
+
+    The segment and its index are memory mapped, and only the blocks that
+    overlap the requested range are decompressed.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.index_path = path.with_suffix(".idx")
+
+    def index(self) -> np.ndarray:
+        if not self.index_path.exists():
+            return np.empty(0, dtype=INDEX_DTYPE)
+        # ignore a partially written trailing index entry
+        n_blocks = self.index_path.stat().st_size // INDEX_DTYPE.itemsize
+        if n_blocks == 0:
+            return np.empty(0, dtype=INDEX_DTYPE)
+        return np.memmap(self.index_path, dtype=INDEX_DTYPE, mode="r", shape=(n_blocks,))
+
+    def read(self, start_ms: Optional[int] = None, end_ms: Optional[int] = None) -> np.ndarray:
+        index = self.index()
+        n_blocks = len(index)
+        lo = 0 if start_ms is None else int(np.searchsorted(index["last_ts"], start_ms, side="left"))
+        hi = n_blocks if end_ms is None else int(np.searchsorted(index["first_ts"], end_ms, side="left"))
+        if lo >= hi:
+            return np.empty(0, dtype=TICK_DTYPE)
+
+        with open(self.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            blocks = [
+                _decode_block(mm[entry["offset"]:entry["offset"] + entry["length"]], int(entry["count"]))
+                for entry in index[lo:hi]
+            ]
+        columns = np.concatenate(blocks, axis=1)
+
+        mask = np.ones(columns.shape[1], dtype=bool)
+        if start_ms is not None:
+            mask &= columns[0] >= start_ms
+        if end_ms is not None:
+            mask &= columns[0] < end_ms
+
+        ticks = np.empty(int(mask.sum()), dtype=TICK_DTYPE)
+        ticks["ts"] = columns[0][mask].astype("datetime64[ms]")
+        ticks["price"] = columns[1][mask] / PRICE_SCALE
+        ticks["compare"] = columns[2][mask] / PRICE_SCALE
+        ticks["volume"] = columns[3][mask]
+        return ticks
+
+
+class TickArchive:
+    """Append-only archive of polled `NaverStockData` snapshots.
+
+    Ticks are stored per local trading day and symbol under
+    `root/YYYY-MM-DD/<symbol>.seg`, in zlib compressed, delta encoded blocks
+    of up to `block_size` ticks. Each block gets a fixed size entry in the
+    `.idx` file next to it, which is used to seek by time.
+
+    Ticks are buffered until a block is full, the oldest buffered tick is
+    `flush_interval` seconds old, the symbol moves on to the next day or
+    `flush()` is called. Only flushed ticks are visible to `read()`.
+    Repeated snapshots (same or older `local_traded_at`) are skipped.
+
+    Buffered ticks are flushed on `close()` (or leaving the `with` block),
+    and at interpreter exit for archives that are still alive. Call
+    `close()` before dropping an archive, e.g. in a worker shutdown hook.
+
+    Several processes may write to the same root: each flush holds an
+    exclusive `flock` on the `.idx` file and drops ticks another writer
+    already stored. On windows, which has no `flock`, use a single writer
+    per root. Within a process, the archive is thread safe, so appends can
+    run in `asyncio.to_thread`.
+    """
+
+    def __init__(self, root: Union[str, Path], block_size: int = 1024, flush_interval: Optional[float] = 60.0):
+        self.root = Path(root)
+        self.block_size = block_size
+        self.flush_interval = flush_interval
+        self._buffers: dict[tuple[str, str], list[tuple[int, int, int, int]]] = {}
+        self._buffered_at: dict[tuple[str, str], float] = {}
+        self._days: dict[str, str] = {}  # symbol -> day of its current buffer
+        self._last_ts: dict[str, int] = {}
+        self._lock = threading.Lock()
+        atexit.register(_close_at_exit, weakref.ref(self))
+
+    def segment_path(self, day: date, symbol: str) -> Path:
+        return self.root / day.isoformat() / (re.sub(r"[^\w.-]", "_", symbol) + ".seg")
+
+    def append(self, stock_data: NaverStockData) -> bool:
+        if stock_data.local_traded_at is None:
+            return False
+        traded_at = datetime.fromisoformat(stock_data.local_traded_at)
+        return self.append_tick(
+            stock_data.symbol_code,
+            traded_at,
+            parse_number(stock_data.close_price),
+            parse_number(stock_data.compare_price),
+            parse_number(stock_data.total_infos.get("거래량")),
+        )
+
+    def append_tick(self, symbol: str, traded_at: datetime, price: float, compare: float, volume: float) -> bool:
+        with self._lock:
+            appended = self._append_tick(symbol, traded_at, price, compare, volume)
+            # also on repeated snapshots, which is all that arrives after the market closes
+            self._flush_expired(time.monotonic())
+            return appended
+
+    def _append_tick(self, symbol: str, traded_at: datetime, price: float, compare: float, volume: float) -> bool:
+        ts = _to_epoch_ms(traded_at)
+        if symbol not in self._last_ts:
+            # resume after a restart without appending out of order ticks
+            index = TickSegment(self.segment_path(traded_at.date(), symbol)).index()
+            self._last_ts[symbol] = int(index["last_ts"][-1]) if len(index) else -1
+        if ts <= self._last_ts[symbol]:
+            return False
+        self._last_ts[symbol] = ts
+
+        # partition by the exchange's local date
+        day = traded_at.date().isoformat()
+        previous_day = self._days.get(symbol)
+        if previous_day is not None and previous_day != day:
+            self._flush_segment((previous_day, symbol))
+        self._days[symbol] = day
+
+        key = (day, symbol)
+        buffer = self._buffers.setdefault(key, [])
+        if not buffer:
+            self._buffered_at[key] = time.monotonic()
+        buffer.append((ts, _fixed(price, PRICE_SCALE), _fixed(compare, PRICE_SCALE), _fixed(volume, 1)))
+        if len(buffer) >= self.block_size:
+            self._flush_segment(key)
+        return True
+
+    def _flush_expired(self, now: float):
+        if self.flush_interval is None:
+            return
+        for key, buffered_at in list(self._buffered_at.items()):
+            if now - buffered_at >= self.flush_interval:
+                self._flush_segment(key)
+
+    def _flush_segment(self, key: tuple[str, str]):
+        buffer = self._buffers.pop(key, None)
+        self._buffered_at.pop(key, None)
+        if not buffer:
+            return
+        day, symbol = key
+        path = self.segment_path(date.fromisoformat(day), symbol)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(path.with_suffix(".idx"), "ab") as index_file:
+            if sys.platform != "win32":
+                fcntl.flock(index_file, fcntl.LOCK_EX)
+            try:
+                # another writer may have stored some of these ticks since they were buffered
+                last_ts = _last_indexed_ts(index_file)
+                self._last_ts[symbol] = max(self._last_ts.get(symbol, -1), last_ts)
+                columns = np.array(buffer, dtype=np.int64).T
+                columns = columns[:, columns[0] > last_ts]
+                if columns.shape[1] == 0:
+                    return
+
+                block = _encode_block(columns)
+                with open(path, "ab") as f:
+                    offset = f.tell()
+                    f.write(block)
+                entry = np.array(
+                    [(columns[0, 0], columns[0, -1], offset, len(block), columns.shape[1])], dtype=INDEX_DTYPE
+                )
+                index_file.write(entry.tobytes())
+                index_file.flush()
+            finally:
+                if sys.platform != "win32":
+                    fcntl.flock(index_file, fcntl.LOCK_UN)
+
+    def flush(self):
+        with self._lock:
+            for key in list(self._buffers):
+                self._flush_segment(key)
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def read(self, symbol: str, start: datetime, end: datetime) -> np.ndarray:
+        """Ticks of `symbol` in [start, end) as a `TICK_DTYPE` structured array."""
+        start_ms, end_ms = _to_epoch_ms(start), _to_epoch_ms(end)
+        # segments are partitioned by the exchange's local date, which may
+        # differ by a day from the dates of `start` and `end`
+        day = start.date() - timedelta(days=1)
+        last_day = end.date() + timedelta(days=1)
+
+        results = []
+        while day <= last_day:
+            path = self.segment_path(day, symbol)
+            if path.exists():
+                results.append(TickSegment(path).read(start_ms, end_ms))
+            day += timedelta(days=1)
+        if not results:
+            return np.empty(0, dtype=TICK_DTYPE)
+        return np.concatenate(results)
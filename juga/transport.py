@@ -0,0 +1,93 @@
+import json
+from abc import ABCMeta, abstractmethod
+from typing import Any, Optional, Union
+
+import aiohttp
+
+
+class HTTPTransport(metaclass=ABCMeta):
+    """Minimal async HTTP client interface used by the scrapers.
+
+    Transports are async context managers. A transport created without an
+    externally owned client opens its own and closes it on exit.
+    """
+
+    @abstractmethod
+    async def get_json(self, url: str) -> Any:
+        pass
+
+    @abstractmethod
+    async def aclose(self) -> None:
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+
+class AiohttpTransport(HTTPTransport):
+    """HTTP/1.1 transport backed by `aiohttp.ClientSession` (default)."""
+
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        self._owns_session = session is None
+        self._session = session
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    async def get_json(self, url: str) -> Any:
+        async with self.session.get(url) as resp:
+            # naver endpoints do not always send `application/json`
+            return await resp.json(content_type=None)
+
+    async def aclose(self) -> None:
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+class HTTPXTransport(HTTPTransport):
+    """Transport backed by `httpx.AsyncClient`, with HTTP/2 enabled by default.
+
+    Over HTTP/2 concurrent requests to the same host are multiplexed onto a
+    single connection instead of opening one connection per in-flight request.
+    Requires the optional `http2` extra (`pip install juga[http2]`).
+    """
+
+    def __init__(self, client=None, http2: bool = True, **client_kwargs):
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError("HTTPXTransport requires httpx. install it with `pip install juga[http2]`") from e
+
+        self._owns_client = client is None
+        if client is None:
+            client = httpx.AsyncClient(http2=http2, **client_kwargs)
+        self._client = client
+
+    @property
+    def client(self):
+        return self._client
+
+    async def get_json(self, url: str) -> Any:
+        resp = await self._client.get(url)
+        return json.loads(resp.content)
+
+    async def aclose(self) -> None:
+        if self._owns_client:
+            await self._client.aclose()
+
+
+TransportLike = Union[HTTPTransport, aiohttp.ClientSession]
+
+
+def as_transport(transport: TransportLike) -> HTTPTransport:
+    """Wrap a bare `aiohttp.ClientSession` so older call sites keep working."""
+    if isinstance(transport, aiohttp.ClientSession):
+        return AiohttpTransport(transport)
+    return transport
@@ -0,0 +1,154 @@
+import random
+
+import pytest
+
+from juga.alerts import Alert, AlertEngine
+from juga.metadata_scraper import NaverStockMetadataScraper
+from juga.naver_stock_api import NaverStockAPI, stream_stock_data
+
+
+def fired(events) -> list[str]:
+    return sorted(event.alert.alert_id for event in events)
+
+
+def test_price_alert_directions():
+    engine = AlertEngine(
+        (
+            Alert("up", "035420", "price", 200_000, direction="up"),
+            Alert("down", "035420", "price", 200_000, direction="down"),
+            Alert("both", "035420", "price", 200_000, once=False),
+            Alert("other", "005930", "price", 200_000),
+        )
+    )
+    assert engine.update("035420", 190_000) == []  # baseline only
+    # reaching the threshold counts as crossing it, leaving it downwards does not
+    assert fired(engine.update("035420", 200_000)) == ["both", "up"]
+    assert engine.update("035420", 199_000) == []
+    assert fired(engine.update("035420", 201_000)) == ["both"]
+    assert fired(engine.update("035420", 199_000)) == ["both", "down"]
+    assert len(engine) == 2
+
+
+def test_move_alert():
+    engine = AlertEngine((Alert("msft", "MSFT", "move", 3),))
+    engine.update("MSFT", 320.0, compare_ratio=0.5)
+    assert engine.update("MSFT", 321.0, compare_ratio=2.9) == []
+    events = engine.update("MSFT", 310.0, compare_ratio=-3.1)
+    assert fired(events) == ["msft"]
+    assert (events[0].previous, events[0].current) == (2.9, -3.1)
+    assert "msft" not in engine
+
+
+@pytest.mark.parametrize(("direction", "expected"), [("up", [[], ["a"]]), ("down", [["a"], []]), ("both", [["a"], []])])
+def test_move_alert_direction(direction, expected):
+    engine = AlertEngine((Alert("a", "MSFT.O", "move", 3, direction=direction),))
+    engine.update("MSFT.O", 320.0, compare_ratio=0.0)
+    assert fired(engine.update("MSFT.O", 310.0, compare_ratio=-3.1)) == expected[0]
+    assert fired(engine.update("MSFT.O", 330.0, compare_ratio=3.1)) == expected[1]
+
+
+async def test_on_quote_keys_by_reuters_code(mock_aioresponse, read_testdata):
+    mock_aioresponse.get(
+        NaverStockMetadataScraper.URL_TEMPLATE.format(query="microsoft"),
+        payload=read_testdata("230826_autocomplete_microsoft_result.json"),
+    )
+    mock_aioresponse.get(
+        "https://api.stock.naver.com/stock/MSFT.O/basic", payload=read_testdata("230826_api_basic_msft_result.json")
+    )
+    stock_data = await (await NaverStockAPI.from_query("microsoft")).fetch_stock_data()
+
+    engine = AlertEngine((Alert("msft", "MSFT.O", "price", 325.0, direction="up"),))
+    assert engine.on_quote(stock_data) == []
+    events = engine.on_quote(stock_data.model_copy(update={"close_price": "326.10"}))
+    assert fired(events) == ["msft"]
+    assert (events[0].previous, events[0].current) == (322.98, 326.10)
+
+
+async def test_run_survives_failing_api(mock_aioresponse, read_testdata, caplog):
+    mock_aioresponse.get(
+        NaverStockMetadataScraper.URL_TEMPLATE.format(query="microsoft"),
+        payload=read_testdata("230826_autocomplete_microsoft_result.json"),
+    )
+    mock_aioresponse.get(
+        "https://api.stock.naver.com/stock/MSFT.O/basic", payload=read_testdata("230826_api_basic_msft_result.json")
+    )
+    msft = await NaverStockAPI.from_query("microsoft")
+    quote = await msft.fetch_stock_data()
+    higher = quote.model_copy(update={"close_price": "326.10"})
+
+    class StubAPI:
+        metadata = msft.metadata
+
+        def __init__(self, *results):
+            self.results = iter(results)
+
+        async def fetch_stock_data(self):
+            result = next(self.results)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+    apis = [StubAPI(quote, ConnectionError(), higher), StubAPI(ConnectionError(), quote, quote)]
+    engine = AlertEngine((Alert("msft", "MSFT.O", "price", 325.0, direction="up"),))
+    event = await engine.run(stream_stock_data(apis, interval=0)).__anext__()
+    assert event.alert.alert_id == "msft"
+    assert caplog.text.count("failed to fetch MSFT.O") == 2
+
+
+def test_many_once_alerts_on_one_threshold():
+    engine = AlertEngine(
+        tuple(Alert(str(i), "035420", "price", 150) for i in range(1000))
+        + (Alert("keep", "035420", "price", 150, once=False), Alert("far", "035420", "price", 300))
+    )
+    engine.update("035420", 100)
+    assert len(engine.update("035420", 160)) == 1001
+    assert engine.alerts == (Alert("keep", "035420", "price", 150, once=False), Alert("far", "035420", "price", 300))
+    assert fired(engine.update("035420", 140)) == ["keep"]
+
+
+def test_hot_add_remove():
+    engine = AlertEngine()
+    engine.update("035420", 100)
+    engine.add(Alert("a", "035420", "price", 150))
+    engine.add(Alert("b", "035420", "price", 150))
+    assert engine.remove("a").alert_id == "a"
+    assert engine.remove("a") is None
+    assert fired(engine.update("035420", 160)) == ["b"]
+    assert len(engine) == 0
+
+
+def test_save_load(tmp_path):
+    alerts = (Alert("a", "035420", "price", 150, direction="up"), Alert("b", "MSFT", "move", 3, once=False))
+    AlertEngine(alerts).save(tmp_path / "alerts.jsonl")
+    AlertEngine(alerts[:1]).save(tmp_path / "alerts.jsonl")
+    assert AlertEngine.load(tmp_path / "alerts.jsonl").alerts == alerts[:1]
+    assert [path.name for path in tmp_path.iterdir()] == ["alerts.jsonl"]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_naive_scan(seed):
+    rng = random.Random(seed)
+    symbols = [f"S{i}" for i in range(5)]
+    alerts = [
+        Alert(
+            str(i), rng.choice(symbols), "price", rng.randint(90, 110), rng.choice(["up", "down", "both"]), once=False
+        )
+        for i in range(300)
+    ]
+    engine = AlertEngine(tuple(alerts))
+    last = {}
+    for _ in range(200):
+        symbol = rng.choice(symbols)
+        price = rng.randint(85, 115)
+        expected = []
+        if symbol in last:
+            previous = last[symbol]
+            for alert in alerts:
+                if alert.symbol != symbol:
+                    continue
+                up = previous < alert.value <= price and alert.direction in ("up", "both")
+                down = price <= alert.value < previous and alert.direction in ("down", "both")
+                if up or down:
+                    expected.append(alert.alert_id)
+        last[symbol] = price
+        assert fired(engine.update(symbol, price)) == sorted(expected)
@@ -24,7 +24,7 @@ from juga.stock_scraper_base import NaverStockData
                 nation_code="KOR",
                 nation_name="대한민국",
             ),
-            '{"name":"NAVER","name_eng":"NAVER","symbol_code":"035420","close_price":"211,000","market_value":"34조 6,144억","stock_exchange_name":"KOSPI","compare_price":"-18,000","compare_ratio":"-7.86","total_infos":{"전일":"229,000","시가":"221,500","고가":"222,000","저가":"210,500","거래량":"2,059,768","대금":"442,787백만","시총":"34조 6,144억","외인소진율":"47.00%","52주 최고":"246,500","52주 최저":"155,000","PER":"47.51배","EPS":"4,441원","추정PER":"35.14배","추정EPS":"6,004원","PBR":"1.41배","BPS":"149,954원","배당수익률":"0.43%","주당배당금":"914원"},"chart_urls":{"candleDay":"https://ssl.pstatic.net/imgfinance/chart/mobile/candle/day/035420_end.png?1692947458000","candleWeek":"https://ssl.pstatic.net/imgfinance/chart/mobile/candle/week/035420_end.png?1692947458000","candleMonth":"https://ssl.pstatic.net/imgfinance/chart/mobile/candle/month/035420_end.png?1692947458000","day":"https://ssl.pstatic.net/imgfinance/chart/mobile/day/035420_end.png?1692947458000","day_up":"https://ssl.pstatic.net/imgfinance/chart/mobile/mini/035420_end_up.png?1692947458000","day_up_tablet":"https://ssl.pstatic.net/imgfinance/chart/mobile/mini/035420_end_up_tablet.png?1692947458000","areaMonthThree":"https://ssl.pstatic.net/imgfinance/chart/mobile/area/month3/035420_end.png?1692947458000","areaYear":"https://ssl.pstatic.net/imgfinance/chart/mobile/area/year/035420_end.png?1692947458000","areaYearThree":"https://ssl.pstatic.net/imgfinance/chart/mobile/area/year3/035420_end.png?1692947458000","areaYearTen":"https://ssl.pstatic.net/imgfinance/chart/mobile/area/year10/035420_end.png?1692947458000","transparent":"https://ssl.pstatic.net/imgfinance/chart/mobile/mini/035420_transparent.png?1692947458000"},"url":"https://m.stock.naver.com/domestic/stock/035420/total"}',  # noqa: E501
+            '{"name":"NAVER","name_eng":"NAVER","symbol_code":"035420","close_price":"211,000","market_value":"34조 6,144억","stock_exchange_name":"KOSPI","compare_price":"-18,000","compare_ratio":"-7.86","total_infos":{"전일":"229,000","시가":"221,500","고가":"222,000","저가":"210,500","거래량":"2,059,768","대금":"442,787백만","시총":"34조 6,144억","외인소진율":"47.00%","52주 최고":"246,500","52주 최저":"155,000","PER":"47.51배","EPS":"4,441원","추정PER":"35.14배","추정EPS":"6,004원","PBR":"1.41배","BPS":"149,954원","배당수익률":"0.43%","주당배당금":"914원"},"chart_urls":{"candleDay":"https://ssl.pstatic.net/imgfinance/chart/mobile/candle/day/035420_end.png?1692947458000","candleWeek":"https://ssl.pstatic.net/imgfinance/chart/mobile/candle/week/035420_end.png?1692947458000","candleMonth":"https://ssl.pstatic.net/imgfinance/chart/mobile/candle/month/035420_end.png?1692947458000","day":"https://ssl.pstatic.net/imgfinance/chart/mobile/day/035420_end.png?1692947458000","day_up":"https://ssl.pstatic.net/imgfinance/chart/mobile/mini/035420_end_up.png?1692947458000","day_up_tablet":"https://ssl.pstatic.net/imgfinance/chart/mobile/mini/035420_end_up_tablet.png?1692947458000","areaMonthThree":"https://ssl.pstatic.net/imgfinance/chart/mobile/area/month3/035420_end.png?1692947458000","areaYear":"https://ssl.pstatic.net/imgfinance/chart/mobile/area/year/035420_end.png?1692947458000","areaYearThree":"https://ssl.pstatic.net/imgfinance/chart/mobile/area/year3/035420_end.png?1692947458000","areaYearTen":"https://ssl.pstatic.net/imgfinance/chart/mobile/area/year10/035420_end.png?1692947458000","transparent":"https://ssl.pstatic.net/imgfinance/chart/mobile/mini/035420_transparent.png?1692947458000"},"url":"https://m.stock.naver.com/domestic/stock/035420/total","local_traded_at":"2023-08-25T16:10:58+09:00","currency":"KRW"}',  # noqa: E501
         ),
         # korea etf
         (
@@ -41,7 +41,7 @@ from juga.stock_scraper_base import NaverStockData
                 nation_code="KOR",
                 nation_name="대한민국",
             ),
-            '{"name":"KODEX 200","name_eng":"KODEX 200","symbol_code":"069500","close_price":"33,080","market_value":"","stock_exchange_name":"KOSPI","compare_price":"-365","compare_ratio":"-1.09","total_infos":{"전일":"33,445","시가":"32,980","고가":"33,210","저가":"32,960","거래량":"1,671,750","대금":"55,283백만","52주 최고":"35,210","원주가 기준":"28,020","52주 최저":"27,419","최근 1개월 수익률":"-4.38%","최근 3개월 수익률":"-1.47%","최근 6개월 수익률":"+4.69%","최근 1년 수익률":"+4.32%","NAV":"33,152.86","펀드보수":"0.150%","기초지수":"코스피 200","운용사":"삼성자산운용(주)"},"chart_urls":{"candleDay":"https://ssl.pstatic.net/imgfinance/chart/mobile/candle/day/069500_end.png?1692947457000","candleWeek":"https://ssl.pstatic.net/imgfinance/chart/mobile/candle/week/069500_end.png?1692947457000","candleMonth":"https://ssl.pstatic.net/imgfinance/chart/mobile/candle/month/069500_end.png?1692947457000","day":"https://ssl.pstatic.net/imgfinance/chart/mobile/day/069500_end.png?1692947457000","day_up":"https://ssl.pstatic.net/imgfinance/chart/mobile/mini/069500_end_up.png?1692947457000","day_up_tablet":"https://ssl.pstatic.net/imgfinance/chart/mobile/mini/069500_end_up_tablet.png?1692947457000","areaMonthThree":"https://ssl.pstatic.net/imgfinance/chart/mobile/area/month3/069500_end.png?1692947457000","areaYear":"https://ssl.pstatic.net/imgfinance/chart/mobile/area/year/069500_end.png?1692947457000","areaYearThree":"https://ssl.pstatic.net/imgfinance/chart/mobile/area/year3/069500_end.png?1692947457000","areaYearTen":"https://ssl.pstatic.net/imgfinance/chart/mobile/area/year10/069500_end.png?1692947457000","transparent":"https://ssl.pstatic.net/imgfinance/chart/mobile/mini/069500_transparent.png?1692947457000"},"url":"https://m.stock.naver.com/domestic/stock/069500/total"}',  # noqa: E501
+            '{"name":"KODEX 200","name_eng":"KODEX 200","symbol_code":"069500","close_price":"33,080","market_value":"","stock_exchange_name":"KOSPI","compare_price":"-365","compare_ratio":"-1.09","total_infos":{"전일":"33,445","시가":"32,980","고가":"33,210","저가":"32,960","거래량":"1,671,750","대금":"55,283백만","52주 최고":"35,210","원주가 기준":"28,020","52주 최저":"27,419","최근 1개월 수익률":"-4.38%","최근 3개월 수익률":"-1.47%","최근 6개월 수익률":"+4.69%","최근 1년 수익률":"+4.32%","NAV":"33,152.86","펀드보수":"0.150%","기초지수":"코스피 200","운용사":"삼성자산운용(주)"},"chart_urls":{"candleDay":"https://ssl.pstatic.net/imgfinance/chart/mobile/candle/day/069500_end.png?1692947457000","candleWeek":"https://ssl.pstatic.net/imgfinance/chart/mobile/candle/week/069500_end.png?1692947457000","candleMonth":"https://ssl.pstatic.net/imgfinance/chart/mobile/candle/month/069500_end.png?1692947457000","day":"https://ssl.pstatic.net/imgfinance/chart/mobile/day/069500_end.png?1692947457000","day_up":"https://ssl.pstatic.net/imgfinance/chart/mobile/mini/069500_end_up.png?1692947457000","day_up_tablet":"https://ssl.pstatic.net/imgfinance/chart/mobile/mini/069500_end_up_tablet.png?1692947457000","areaMonthThree":"https://ssl.pstatic.net/imgfinance/chart/mobile/area/month3/069500_end.png?1692947457000","areaYear":"https://ssl.pstatic.net/imgfinance/chart/mobile/area/year/069500_end.png?1692947457000","areaYearThree":"https://ssl.pstatic.net/imgfinance/chart/mobile/area/year3/069500_end.png?1692947457000","areaYearTen":"https://ssl.pstatic.net/imgfinance/chart/mobile/area/year10/069500_end.png?1692947457000","transparent":"https://ssl.pstatic.net/imgfinance/chart/mobile/mini/069500_transparent.png?1692947457000"},"url":"https://m.stock.naver.com/domestic/stock/069500/total","local_traded_at":"2023-08-25T16:10:57+09:00","currency":"KRW"}',  # noqa: E501
         ),
     ],
 )
@@ -78,7 +78,7 @@ async def test_fetch_korea_stock(basic_mockdata_filename, int_mockdata_filename,
                 nation_code="USA",
                 nation_name="미국",
             ),
-            '{"name":"마이크로소프트","name_eng":"Microsoft Corp","symbol_code":"MSFT","close_price":"322.98","market_value":"2조 3,997억 USD","stock_exchange_name":"NASDAQ","compare_price":"3.01","compare_ratio":"0.94","total_infos":{"전일":"319.97","시가":"321.47","고가":"325.36","저가":"318.80","거래량":"21,684,104","대금":"70억 USD","시총":"2조 3,997억 USD","업종":"소프트웨어","52주 최고":"366.78","52주 최저":"213.43","PER":"32.91배","EPS":"9.81","PBR":"11.64배","BPS":"27.75","주당배당금":"2.72","배당수익률":"0.85%","배당일":"2023.09.14.","배당락일":"2023.08.16.","액면변경":"N/A","액면가":"N/A"},"chart_urls":{"candleDay":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/candle/day/MSFT.O_end.png?1692946800000","candleWeek":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/candle/week/MSFT.O_end.png?1692946800000","candleMonth":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/candle/month/MSFT.O_end.png?1692946800000","day":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/day/MSFT.O_end.png?1692946800000","day_up":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/day/MSFT.O_end_up.png?1692946800000","day_up_tablet":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/day/MSFT.O_end_up_tablet.png?1692946800000","areaMonthThree":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/area/month3/MSFT.O_end.png?1692946800000","areaYear":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/area/year/MSFT.O_end.png?1692946800000","areaYearThree":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/area/year3/MSFT.O_end.png?1692946800000","areaYearTen":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/area/year10/MSFT.O_end.png?1692946800000","transparent":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/day/MSFT.O_transparent.png?1692946800000"},"url":"https://m.stock.naver.com/worldstock/stock/MSFT.O/total"}',  # noqa: E501
+            '{"name":"마이크로소프트","name_eng":"Microsoft Corp","symbol_code":"MSFT","close_price":"322.98","market_value":"2조 3,997억 USD","stock_exchange_name":"NASDAQ","compare_price":"3.01","compare_ratio":"0.94","total_infos":{"전일":"319.97","시가":"321.47","고가":"325.36","저가":"318.80","거래량":"21,684,104","대금":"70억 USD","시총":"2조 3,997억 USD","업종":"소프트웨어","52주 최고":"366.78","52주 최저":"213.43","PER":"32.91배","EPS":"9.81","PBR":"11.64배","BPS":"27.75","주당배당금":"2.72","배당수익률":"0.85%","배당일":"2023.09.14.","배당락일":"2023.08.16.","액면변경":"N/A","액면가":"N/A"},"chart_urls":{"candleDay":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/candle/day/MSFT.O_end.png?1692946800000","candleWeek":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/candle/week/MSFT.O_end.png?1692946800000","candleMonth":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/candle/month/MSFT.O_end.png?1692946800000","day":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/day/MSFT.O_end.png?1692946800000","day_up":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/day/MSFT.O_end_up.png?1692946800000","day_up_tablet":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/day/MSFT.O_end_up_tablet.png?1692946800000","areaMonthThree":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/area/month3/MSFT.O_end.png?1692946800000","areaYear":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/area/year/MSFT.O_end.png?1692946800000","areaYearThree":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/area/year3/MSFT.O_end.png?1692946800000","areaYearTen":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/area/year10/MSFT.O_end.png?1692946800000","transparent":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/day/MSFT.O_transparent.png?1692946800000"},"url":"https://m.stock.naver.com/worldstock/stock/MSFT.O/total","local_traded_at":"2023-08-25T16:00:00-04:00","currency":"USD"}',  # noqa: E501
         ),
         # global etf
         (
@@ -94,7 +94,7 @@ async def test_fetch_korea_stock(basic_mockdata_filename, int_mockdata_filename,
                 nation_code="USA",
                 nation_name="미국",
             ),
-            '{"name":"Invesco QQQ Trust Series 1","name_eng":"Invesco QQQ Trust Series 1","symbol_code":"QQQ","close_price":"364.02","market_value":"","stock_exchange_name":"NASDAQ","compare_price":"2.80","compare_ratio":"0.78","total_infos":{"전일":"361.22","시가":"362.07","고가":"365.74","저가":"358.58","거래량":"69,960,465","대금":"253억 USD","수익기준일":"2023.08.24.","NAV":"361.12","최근 1개월 수익률":"-1.86%","최근 3개월 수익률":"11.48%","최근 6개월 수익률":"26.90%","최근 1년 수익률":"18.05%","배당기준일":"2023.06.20.","배당금":"0.50","액면변경":"N/A","액면가":"N/A","운용사":"Invesco Capital Management LLC","설정일":"1999.03.10."},"chart_urls":{"candleDay":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/candle/day/QQQ.O_end.png?1692946800000","candleWeek":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/candle/week/QQQ.O_end.png?1692946800000","candleMonth":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/candle/month/QQQ.O_end.png?1692946800000","day":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/day/QQQ.O_end.png?1692946800000","day_up":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/day/QQQ.O_end_up.png?1692946800000","day_up_tablet":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/day/QQQ.O_end_up_tablet.png?1692946800000","areaMonthThree":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/area/month3/QQQ.O_end.png?1692946800000","areaYear":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/area/year/QQQ.O_end.png?1692946800000","areaYearThree":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/area/year3/QQQ.O_end.png?1692946800000","areaYearTen":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/area/year10/QQQ.O_end.png?1692946800000","transparent":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/day/QQQ.O_transparent.png?1692946800000"},"url":"https://m.stock.naver.com/worldstock/stock/QQQ.O/total"}',  # noqa: E501
+            '{"name":"Invesco QQQ Trust Series 1","name_eng":"Invesco QQQ Trust Series 1","symbol_code":"QQQ","close_price":"364.02","market_value":"","stock_exchange_name":"NASDAQ","compare_price":"2.80","compare_ratio":"0.78","total_infos":{"전일":"361.22","시가":"362.07","고가":"365.74","저가":"358.58","거래량":"69,960,465","대금":"253억 USD","수익기준일":"2023.08.24.","NAV":"361.12","최근 1개월 수익률":"-1.86%","최근 3개월 수익률":"11.48%","최근 6개월 수익률":"26.90%","최근 1년 수익률":"18.05%","배당기준일":"2023.06.20.","배당금":"0.50","액면변경":"N/A","액면가":"N/A","운용사":"Invesco Capital Management LLC","설정일":"1999.03.10."},"chart_urls":{"candleDay":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/candle/day/QQQ.O_end.png?1692946800000","candleWeek":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/candle/week/QQQ.O_end.png?1692946800000","candleMonth":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/candle/month/QQQ.O_end.png?1692946800000","day":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/day/QQQ.O_end.png?1692946800000","day_up":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/day/QQQ.O_end_up.png?1692946800000","day_up_tablet":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/day/QQQ.O_end_up_tablet.png?1692946800000","areaMonthThree":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/area/month3/QQQ.O_end.png?1692946800000","areaYear":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/area/year/QQQ.O_end.png?1692946800000","areaYearThree":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/area/year3/QQQ.O_end.png?1692946800000","areaYearTen":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/area/year10/QQQ.O_end.png?1692946800000","transparent":"https://ssl.pstatic.net/imgfinance/chart/mobile/world/item/day/QQQ.O_transparent.png?1692946800000"},"url":"https://m.stock.naver.com/worldstock/stock/QQQ.O/total","local_traded_at":"2023-08-25T16:00:00-04:00","currency":"USD"}',  # noqa: E501
         ),
     ],
 )
@@ -0,0 +1,147 @@
+import asyncio
+
+import pytest
+
+from juga.market_index_scraper import NaverFXRateScraper
+from juga.metadata_scraper import NaverStockMetadataScraper
+from juga.portfolio import FXRateCache, Holding, Portfolio
+from juga.transport import AiohttpTransport
+
+
+MSFT_BASIC_URL = "https://api.stock.naver.com/stock/MSFT.O/basic"
+ROUTES = {
+    NaverStockMetadataScraper.URL_TEMPLATE.format(query="naver"): "230826_autocomplete_naver_result.json",
+    NaverStockMetadataScraper.URL_TEMPLATE.format(query="microsoft"): "230826_autocomplete_microsoft_result.json",
+    "https://m.stock.naver.com/api/stock/035420/basic": "230826_m_api_basic_naver_result.json",
+    "https://m.stock.naver.com/api/stock/035420/integration": "230826_m_api_integration_naver_result.json",
+    MSFT_BASIC_URL: "230826_api_basic_msft_result.json",
+}
+
+
+@pytest.fixture()
+def mock_naver_api(mock_aioresponse, read_testdata):
+    for url, filename in ROUTES.items():
+        mock_aioresponse.get(url, payload=read_testdata(filename), repeat=True)
+    return mock_aioresponse
+
+
+def fx_fetcher(rates: dict[str, float]):
+    calls = []
+
+    async def fetch(currency: str) -> float:
+        calls.append(currency)
+        await asyncio.sleep(0)
+        return rates[currency]
+
+    fetch.calls = calls
+    return fetch
+
+
+async def test_refresh(mock_naver_api):
+    fetch = fx_fetcher({"USD": 1300.0})
+    async with AiohttpTransport() as transport:
+        portfolio = Portfolio(
+            [Holding("naver", 10), Holding("microsoft", 2), Holding("naver", 5)],
+            transport=transport,
+            fx_fetcher=fetch,
+        )
+        valuation = await portfolio.refresh()
+
+    assert valuation.subtotals == {"KRW": 15 * 211_000, "USD": pytest.approx(2 * 322.98)}
+    assert valuation.total == pytest.approx(15 * 211_000 + 2 * 322.98 * 1300)
+    assert [position.currency for position in valuation.positions] == ["KRW", "USD", "KRW"]
+    assert fetch.calls == ["USD"]
+
+
+async def test_unparsable_price_is_missing(mock_aioresponse, read_testdata):
+    for url, filename in ROUTES.items():
+        payload = read_testdata(filename)
+        if url == MSFT_BASIC_URL:
+            payload["closePrice"] = "-"
+        mock_aioresponse.get(url, payload=payload, repeat=True)
+
+    async with AiohttpTransport() as transport:
+        portfolio = Portfolio(
+            [Holding("naver", 10), Holding("microsoft", 2)], transport=transport, fx_fetcher=fx_fetcher({"USD": 1300.0})
+        )
+        valuation = await portfolio.refresh()
+        msft = await portfolio.apis[1].fetch_stock_data()
+
+    assert valuation.missing == ("MSFT",)
+    assert valuation.positions[1].missing and not valuation.positions[0].missing
+    assert valuation.total == 10 * 211_000
+    assert valuation.subtotals["USD"] == 0.0
+
+    # a later quote with a price fills it in
+    assert portfolio.on_quote(msft.model_copy(update={"close_price": "322.98"})) == pytest.approx(
+        10 * 211_000 + 2 * 322.98 * 1300
+    )
+    assert portfolio.valuation().missing == ()
+
+
+async def test_incremental_updates_match_full_revaluation(mock_naver_api):
+    async with AiohttpTransport() as transport:
+        portfolio = Portfolio(
+            [Holding("naver", 10), Holding("microsoft", 2)],
+            base_currency="USD",
+            transport=transport,
+            fx_fetcher=fx_fetcher({"USD": 1300.0}),
+        )
+        await portfolio.refresh()
+        naver, msft = [await api.fetch_stock_data() for api in portfolio.apis]
+
+    assert portfolio.total == pytest.approx(10 * 211_000 / 1300 + 2 * 322.98)
+
+    portfolio.on_quote(naver.model_copy(update={"close_price": "220,000"}))
+    portfolio.on_quote(msft.model_copy(update={"close_price": "330.00"}))
+    portfolio.on_fx_rate("USD", 1250.0)
+    expected = 10 * 220_000 / 1250 + 2 * 330.00
+    assert portfolio.total == pytest.approx(expected)
+
+    portfolio._recompute()
+    assert portfolio.total == pytest.approx(expected)
+    assert portfolio.valuation().fx_rates == {"KRW": 1 / 1250, "USD": 1.0}
+
+
+async def test_portfolios_share_fx_rate_cache(mock_naver_api):
+    fetch = fx_fetcher({"USD": 1300.0})
+    fx_rates = FXRateCache(fetch)
+    async with AiohttpTransport() as transport:
+        for holdings in ([Holding("microsoft", 2)], [Holding("naver", 1), Holding("microsoft", 1)]):
+            await Portfolio(holdings, transport=transport, fx_rates=fx_rates).refresh()
+    assert fetch.calls == ["USD"]
+
+
+async def test_fx_rate_cache_ttl():
+    fetch = fx_fetcher({"USD": 1300.0})
+    cache = FXRateCache(fetch, ttl=0.05)
+    assert await asyncio.gather(*(cache.get("USD") for _ in range(5))) == [1300.0] * 5
+    assert await cache.get("KRW") == 1.0
+    assert fetch.calls == ["USD"]
+
+    await asyncio.sleep(0.06)
+    await cache.get("USD")
+    assert fetch.calls == ["USD", "USD"]
+
+
+@pytest.mark.parametrize(
+    ("currency", "payload", "expected"),
+    [
+        ("USD", {"exchangeInfo": {"closePrice": "1,336.50"}}, 1336.5),
+        ("JPY", {"exchangeInfo": {"closePrice": "905.12"}}, 9.0512),
+    ],
+)
+async def test_fetch_fx_rate(currency, payload, expected, mock_aioresponse):
+    mock_aioresponse.get(NaverFXRateScraper.URL_TEMPLATE.format(currency=currency), payload=payload)
+    async with AiohttpTransport() as transport:
+        assert await NaverFXRateScraper.fetch_rate(transport, currency) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    "payload", [{"closePrice": "1,336.50"}, {"exchangeInfo": None}, {"exchangeInfo": {"closePrice": "-"}}]
+)
+async def test_fetch_fx_rate_fails_loudly(payload, mock_aioresponse):
+    mock_aioresponse.get(NaverFXRateScraper.URL_TEMPLATE.format(currency="USD"), payload=payload)
+    async with AiohttpTransport() as transport:
+        with pytest.raises(ValueError):
+            await NaverFXRateScraper.fetch_rate(transport, "USD")
@@ -0,0 +1,99 @@
+import math
+
+import pytest
+
+from juga.naver_stock_models import NaverStockChartURLs
+from juga.numeric import parse_number
+from juga.screener import Comparison, InvalidScreenerQuery, Screener, ScreenerQuery
+from juga.stock_scraper_base import NaverStockData
+
+
+@pytest.fixture()
+def snapshots(read_testdata):
+    chart_urls = NaverStockChartURLs(**read_testdata("230826_m_api_basic_naver_result.json")["imageCharts"])
+    rows = [
+        # symbol, PER, 배당수익률, compare_ratio
+        ("A", "8.50배", "4.10%", "-1.20"),
+        ("B", "12.00배", "5.00%", "2.50"),
+        ("C", "6.00배", "3.50%", "0.30"),
+        ("D", "N/A", "6.00%", "-3.00"),
+        ("E", "9.99배", "N/A", "1.00"),
+    ]
+    return [
+        NaverStockData(
+            name=symbol,
+            name_eng=symbol,
+            symbol_code=symbol,
+            close_price="10,000",
+            market_value="1조",
+            stock_exchange_name="KOSPI",
+            compare_price="0",
+            compare_ratio=compare_ratio,
+            total_infos={"PER": per, "배당수익률": dividend},
+            chart_urls=chart_urls,
+            url=f"https://m.stock.naver.com/domestic/stock/{symbol}/total",
+        )
+        for symbol, per, dividend, compare_ratio in rows
+    ]
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("211,000", 211000.0),
+        ("🔺3.01", 3.01),
+        ("-7.86%", -7.86),
+        ("32.91배", 32.91),
+        ("34조 6,144억", 34e12 + 6144e8),
+        ("70억 USD", 70e8),
+        ("442,787백만", 442_787e6),
+        ("-1,200만", -1200e4),
+        ("2023.09.14.", math.nan),
+        ("N/A", math.nan),
+        (None, math.nan),
+    ],
+)
+def test_parse_number(text, expected):
+    result = parse_number(text)
+    if math.isnan(expected):
+        assert math.isnan(result)
+    else:
+        assert result == pytest.approx(expected)
+
+
+def test_parse_query():
+    query = ScreenerQuery.parse('PER < 10 and "52주 최고" >= 3% order by compare_ratio desc, PBR limit 3')
+    assert query.fields == {"PER", "52주 최고", "compare_ratio", "PBR"}
+    assert query.order_by == (("compare_ratio", True), ("PBR", False))
+    assert query.limit == 3
+    assert query.condition.operands[1] == Comparison("52주 최고", ">=", 3.0)
+
+
+@pytest.mark.parametrize("text", ["PER <", "PER < abc", "(PER < 1", "PER < 1 order", "PER < 1 limit"])
+def test_parse_invalid_query(text):
+    with pytest.raises(InvalidScreenerQuery):
+        ScreenerQuery.parse(text)
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("PER < 10 and 배당수익률 > 3% order by compare_ratio", ["A", "C"]),
+        ("PER < 10 and 배당수익률 > 3% order by compare_ratio desc", ["C", "A"]),
+        ("PER >= 10 or 배당수익률 >= 6%", ["B", "D"]),
+        # N/A is unknown, so it matches neither a condition nor its negation
+        ("not PER < 10", ["B"]),
+        ("not (PER < 10 or 배당수익률 >= 6%)", ["B"]),
+        ("not (PER < 7 and 배당수익률 >= 6%)", ["A", "B", "C", "E"]),
+        ("PER != 6", ["A", "B", "E"]),
+        ("order by PER limit 2", ["C", "A"]),
+        ("order by 배당수익률 desc", ["D", "B", "A", "C", "E"]),
+    ],
+)
+def test_screen(snapshots, query, expected):
+    assert [stock_data.symbol_code for stock_data in Screener(snapshots).screen(query)] == expected
+
+
+def test_screen_unknown_field(snapshots):
+    with pytest.raises(InvalidScreenerQuery):
+        Screener(snapshots).screen("PERR < 10")
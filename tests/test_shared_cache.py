@@ -0,0 +1,159 @@
+import asyncio
+import sqlite3
+import time
+
+import pytest
+
+from juga.korea_stock_scraper import NaverStockKoreaStockScraper
+from juga.metadata_scraper import NaverStockMetadata
+from juga.shared_cache import (
+    dump_metadata,
+    dump_stock_data,
+    load_metadata,
+    load_stock_data,
+    RedisCacheBackend,
+    SharedCache,
+    SQLiteCacheBackend,
+)
+from juga.transport import AiohttpTransport
+
+NAVER_METADATA = NaverStockMetadata(
+    symbol_code="035420",
+    display_name="NAVER",
+    stock_exchange_code="KOSPI",
+    stock_exchange_name="코스피",
+    url="https://m.stock.naver.com/domestic/stock/035420/total",
+    reuters_code="035420",
+    nation_code="KOR",
+    nation_name="대한민국",
+)
+
+
+class FakeRedis:
+    """In-memory stand-in for the subset of the redis client we use."""
+
+    def __init__(self):
+        self.data: dict[str, tuple[bytes, float]] = {}
+
+    def get(self, key):
+        value = self.data.get(key)
+        if value is None or value[1] <= time.time():
+            return None
+        return value[0]
+
+    def set(self, key, value, nx=False, px=None):
+        if nx and self.get(key) is not None:
+            return None
+        self.data[key] = (value, time.time() + px / 1000)
+        return True
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+
+@pytest.fixture(params=["sqlite", "redis"])
+def make_backend(request, tmp_path):
+    # each call returns a new backend instance, like a separate worker would
+    if request.param == "sqlite":
+        return lambda: SQLiteCacheBackend(str(tmp_path / "cache.db"))
+    redis = FakeRedis()
+    return lambda: RedisCacheBackend(redis)
+
+
+def test_backend_get_set_expire(make_backend):
+    backend = make_backend()
+    backend.set("a", b"1", ttl=60)
+    backend.set("b", b"2", ttl=-1)
+    assert backend.get("a") == b"1"
+    assert backend.get("b") is None
+    assert make_backend().get("a") == b"1"
+
+
+def test_backend_lock_is_exclusive(make_backend):
+    worker1, worker2 = make_backend(), make_backend()
+    assert worker1.acquire_lock("k", ttl=60)
+    assert not worker2.acquire_lock("k", ttl=60)
+    worker2.release_lock("k")  # not the owner, must be a no-op
+    assert not worker2.acquire_lock("k", ttl=60)
+    worker1.release_lock("k")
+    assert worker2.acquire_lock("k", ttl=60)
+
+
+def test_backend_lock_expires(make_backend):
+    worker1, worker2 = make_backend(), make_backend()
+    assert worker1.acquire_lock("k", ttl=0.01)
+    time.sleep(0.02)
+    assert worker2.acquire_lock("k", ttl=60)
+
+
+async def test_only_one_worker_refreshes(make_backend):
+    workers = [SharedCache(make_backend(), poll_interval=0.001) for _ in range(4)]
+    calls = 0
+
+    async def fetch() -> bytes:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return b"fresh"
+
+    results = await asyncio.gather(
+        *(worker.get_or_fetch("stock:x", fetch, ttl=60) for worker in workers for _ in range(5))
+    )
+    assert results == [b"fresh"] * 20
+    assert calls == 1
+
+
+def test_metadata_roundtrip():
+    assert load_metadata(dump_metadata((NAVER_METADATA,))) == (NAVER_METADATA,)
+
+
+async def test_stock_data_roundtrip(mock_aioresponse, read_testdata):
+    mock_aioresponse.get(
+        "https://m.stock.naver.com/api/stock/035420/basic",
+        payload=read_testdata("230826_m_api_basic_naver_result.json"),
+    )
+    mock_aioresponse.get(
+        "https://m.stock.naver.com/api/stock/035420/integration",
+        payload=read_testdata("230826_m_api_integration_naver_result.json"),
+    )
+    async with AiohttpTransport() as transport:
+        stock_data = await NaverStockKoreaStockScraper(NAVER_METADATA).fetch_stock_data(transport)
+
+    assert dict(load_stock_data(dump_stock_data(stock_data))) == dict(stock_data)
+
+
+async def test_slow_backend_does_not_block_event_loop(tmp_path):
+    class SlowBackend(SQLiteCacheBackend):
+        def get(self, key):
+            time.sleep(0.2)
+            return super().get(key)
+
+    cache = SharedCache(SlowBackend(str(tmp_path / "cache.db")))
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    task = asyncio.ensure_future(ticker())
+    await cache.get_or_fetch("k", lambda: asyncio.sleep(0, result=b"v"), ttl=60)
+    task.cancel()
+    assert ticks >= 10
+
+
+async def test_sqlite_close_closes_every_thread_connection(tmp_path):
+    backend = SQLiteCacheBackend(str(tmp_path / "cache.db"))
+    backend.set("k", b"v", ttl=60)
+    await asyncio.gather(*(asyncio.to_thread(backend.get, "k") for _ in range(4)))
+    conns = [conn for _, conn in backend._conns]
+    assert len(conns) > 1
+
+    backend.close()
+    for conn in conns:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+    # pool threads reconnect after close()
+    assert await asyncio.to_thread(backend.get, "k") == b"v"
+    backend.close()
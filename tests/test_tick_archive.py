@@ -0,0 +1,165 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from juga.metadata_scraper import NaverStockMetadata
+from juga.naver_stock_api import NaverStockAPI
+from juga.naver_stock_models import NaverStockChartURLs
+from juga.stock_scraper_base import NaverStockData
+from juga.tick_archive import TickArchive, TickSegment
+
+KST = timezone(timedelta(hours=9))
+OPEN = datetime(2023, 8, 25, 9, 0, tzinfo=KST)
+
+
+def fill(archive: TickArchive, n_ticks: int, symbol: str = "035420", start: datetime = OPEN):
+    for i in range(n_ticks):
+        archive.append_tick(symbol, start + timedelta(seconds=10 * i), 211_000 + 100 * (i % 7), -18_000 + i, 1000 * i)
+
+
+def test_roundtrip(tmp_path):
+    with TickArchive(tmp_path, block_size=16) as archive:
+        fill(archive, 100)
+
+    ticks = TickArchive(tmp_path).read("035420", OPEN, OPEN + timedelta(days=1))
+    assert len(ticks) == 100
+    assert ticks["ts"][0] == np.datetime64(OPEN.astimezone(timezone.utc).replace(tzinfo=None), "ms")
+    np.testing.assert_array_equal(ticks["price"], [211_000 + 100 * (i % 7) for i in range(100)])
+    np.testing.assert_array_equal(ticks["compare"], [-18_000 + i for i in range(100)])
+    np.testing.assert_array_equal(ticks["volume"], [1000 * i for i in range(100)])
+
+
+def test_range_seek_only_reads_overlapping_blocks(tmp_path):
+    with TickArchive(tmp_path, block_size=10) as archive:
+        fill(archive, 95)
+
+    path = archive.segment_path(OPEN.date(), "035420")
+    assert len(TickSegment(path).index()) == 10
+
+    start, end = OPEN + timedelta(seconds=200), OPEN + timedelta(seconds=300)
+    ticks = archive.read("035420", start, end)
+    assert len(ticks) == 10
+    assert ticks["volume"][0] == 20_000
+
+
+def test_skips_repeated_snapshots_across_restarts(tmp_path):
+    with TickArchive(tmp_path) as archive:
+        fill(archive, 5)
+    with TickArchive(tmp_path) as archive:
+        fill(archive, 8)  # the first 5 are already stored
+
+    assert len(TickArchive(tmp_path).read("035420", OPEN, OPEN + timedelta(days=1))) == 8
+
+
+def test_partitioned_by_local_day(tmp_path):
+    est = timezone(timedelta(hours=-4))
+    with TickArchive(tmp_path) as archive:
+        fill(archive, 3, symbol="MSFT", start=datetime(2023, 8, 25, 23, 59, 50, tzinfo=est))
+
+    assert archive.segment_path(datetime(2023, 8, 25).date(), "MSFT").exists()
+    assert archive.segment_path(datetime(2023, 8, 26).date(), "MSFT").exists()
+    assert len(archive.read("MSFT", OPEN, OPEN + timedelta(days=2))) == 3
+
+
+def test_concurrent_writers_do_not_duplicate_ticks(tmp_path):
+    first, second = TickArchive(tmp_path), TickArchive(tmp_path)
+    fill(first, 10)
+    fill(second, 15)
+    second.flush()
+    first.flush()  # everything it buffered is already stored
+    fill(first, 20)
+    first.flush()
+
+    ticks = TickArchive(tmp_path).read("035420", OPEN, OPEN + timedelta(days=1))
+    np.testing.assert_array_equal(ticks["volume"], [1000 * i for i in range(20)])
+    assert len(TickSegment(first.segment_path(OPEN.date(), "035420")).index()) == 2
+
+
+def test_flush_interval(tmp_path):
+    archive = TickArchive(tmp_path, flush_interval=0.05)
+    fill(archive, 3)
+    assert len(archive.read("035420", OPEN, OPEN + timedelta(days=1))) == 0
+
+    time.sleep(0.06)
+    fill(archive, 1, symbol="005930")  # any append flushes the expired buffers
+    assert len(archive.read("035420", OPEN, OPEN + timedelta(days=1))) == 3
+    assert len(archive.read("005930", OPEN, OPEN + timedelta(days=1))) == 0
+
+
+def test_repeated_snapshots_flush_expired_buffers(tmp_path):
+    archive = TickArchive(tmp_path, flush_interval=0.05)
+    fill(archive, 3)
+    time.sleep(0.06)
+    # after the close every poll repeats the last tick
+    for _ in range(5):
+        assert not archive.append_tick("035420", OPEN + timedelta(seconds=20), 211_000, -18_000, 0)
+    assert len(archive.read("035420", OPEN, OPEN + timedelta(days=1))) == 3
+
+
+def test_flushes_previous_day_on_rollover(tmp_path):
+    est = timezone(timedelta(hours=-4))
+    archive = TickArchive(tmp_path, flush_interval=None)
+    fill(archive, 3, symbol="MSFT", start=datetime(2023, 8, 25, 23, 59, 50, tzinfo=est))
+
+    assert len(TickSegment(archive.segment_path(datetime(2023, 8, 25).date(), "MSFT")).index()) == 1
+    assert not archive.segment_path(datetime(2023, 8, 26).date(), "MSFT").exists()
+
+
+def test_append_stock_data(tmp_path, read_testdata):
+    stock_data = NaverStockData(
+        name="NAVER",
+        name_eng="NAVER",
+        symbol_code="035420",
+        close_price="211,000",
+        market_value="34조 6,144억",
+        stock_exchange_name="KOSPI",
+        compare_price="-18,000",
+        compare_ratio="-7.86",
+        total_infos={"거래량": "1,646,738"},
+        chart_urls=NaverStockChartURLs(**read_testdata("230826_m_api_basic_naver_result.json")["imageCharts"]),
+        url="https://m.stock.naver.com/domestic/stock/035420/total",
+        local_traded_at="2023-08-25T16:10:58+09:00",
+    )
+    with TickArchive(tmp_path) as archive:
+        assert archive.append(stock_data)
+        assert not archive.append(stock_data)
+
+    (tick,) = archive.read("035420", OPEN, OPEN + timedelta(days=1))
+    assert (tick["price"], tick["compare"], tick["volume"]) == (211_000, -18_000, 1_646_738)
+
+
+async def test_api_hook_appends_off_the_event_loop(tmp_path, monkeypatch, mock_aioresponse, read_testdata):
+    mock_aioresponse.get(
+        "https://m.stock.naver.com/api/stock/035420/basic",
+        payload=read_testdata("230826_m_api_basic_naver_result.json"),
+    )
+    mock_aioresponse.get(
+        "https://m.stock.naver.com/api/stock/035420/integration",
+        payload=read_testdata("230826_m_api_integration_naver_result.json"),
+    )
+    threads = []
+
+    class RecordingArchive(TickArchive):
+        def append(self, stock_data):
+            threads.append(threading.get_ident())
+            return super().append(stock_data)
+
+    archive = RecordingArchive(tmp_path)
+    monkeypatch.setattr(NaverStockAPI, "tick_archive", archive)
+    metadata = NaverStockMetadata(
+        symbol_code="035420",
+        display_name="NAVER",
+        stock_exchange_code="KOSPI",
+        stock_exchange_name="코스피",
+        url="https://m.stock.naver.com/domestic/stock/035420/total",
+        reuters_code="035420",
+        nation_code="KOR",
+        nation_name="대한민국",
+    )
+
+    await NaverStockAPI(metadata).fetch_stock_data()
+    archive.close()
+    assert threads and threads[0] != threading.get_ident()
+    assert len(archive.read("035420", OPEN, OPEN + timedelta(days=1))) == 1
@@ -0,0 +1,91 @@
+from dataclasses import asdict
+
+import httpx
+import pytest
+
+from juga.metadata_scraper import NaverStockMetadata, NaverStockMetadataScraper
+from juga.naver_stock_api import NaverStockAPI, NaverStockGlobalStockScraper, NaverStockKoreaStockScraper
+from juga.transport import AiohttpTransport, HTTPXTransport
+
+NAVER_METADATA = NaverStockMetadata(
+    symbol_code="035420",
+    display_name="NAVER",
+    stock_exchange_code="KOSPI",
+    stock_exchange_name="코스피",
+    url="https://m.stock.naver.com/domestic/stock/035420/total",
+    reuters_code="035420",
+    nation_code="KOR",
+    nation_name="대한민국",
+)
+
+MICROSOFT_METADATA = NaverStockMetadata(
+    symbol_code="MSFT",
+    display_name="Microsoft Corp",
+    stock_exchange_code="NASDAQ",
+    stock_exchange_name="나스닥 증권거래소",
+    url="https://m.stock.naver.com/worldstock/stock/MSFT.O/total",
+    reuters_code="MSFT.O",
+    nation_code="USA",
+    nation_name="미국",
+)
+
+
+@pytest.fixture()
+def httpx_transport(read_testdata):
+    routes = {
+        NaverStockMetadataScraper.URL_TEMPLATE.format(query="naver"): "230826_autocomplete_naver_result.json",
+        "https://m.stock.naver.com/api/stock/035420/basic": "230826_m_api_basic_naver_result.json",
+        "https://m.stock.naver.com/api/stock/035420/integration": "230826_m_api_integration_naver_result.json",
+        "https://api.stock.naver.com/stock/MSFT.O/basic": "230826_api_basic_msft_result.json",
+    }
+    # httpx normalizes the url, so compare against the normalized form
+    routes = {str(httpx.URL(url)): filename for url, filename in routes.items()}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=read_testdata(routes[str(request.url)]))
+
+    return HTTPXTransport(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+
+async def test_fetch_metadata_with_httpx(httpx_transport):
+    ret = await NaverStockMetadataScraper.fetch_metadata(httpx_transport, "naver")
+    assert asdict(ret[0]) == asdict(NAVER_METADATA)
+
+
+@pytest.mark.parametrize(
+    ("scraper_cls", "metadata"),
+    [
+        (NaverStockKoreaStockScraper, NAVER_METADATA),
+        (NaverStockGlobalStockScraper, MICROSOFT_METADATA),
+    ],
+)
+async def test_transports_return_same_stock_data(
+    scraper_cls, metadata, httpx_transport, mock_aioresponse, read_testdata
+):
+    mock_aioresponse.get(
+        "https://m.stock.naver.com/api/stock/035420/basic",
+        payload=read_testdata("230826_m_api_basic_naver_result.json"),
+    )
+    mock_aioresponse.get(
+        "https://m.stock.naver.com/api/stock/035420/integration",
+        payload=read_testdata("230826_m_api_integration_naver_result.json"),
+    )
+    mock_aioresponse.get(
+        "https://api.stock.naver.com/stock/MSFT.O/basic",
+        payload=read_testdata("230826_api_basic_msft_result.json"),
+    )
+
+    scraper = scraper_cls(metadata)
+    async with AiohttpTransport() as transport:
+        aiohttp_result = await scraper.fetch_stock_data(transport)
+    async with httpx_transport:
+        httpx_result = await scraper.fetch_stock_data(httpx_transport)
+
+    assert dict(aiohttp_result) == dict(httpx_result)
+
+
+async def test_api_uses_given_transport(httpx_transport):
+    async with httpx_transport:
+        api = NaverStockAPI(MICROSOFT_METADATA, transport=httpx_transport)
+        result = await api.fetch_stock_data()
+    assert result.symbol_code == "MSFT"